@@ -2,21 +2,25 @@
 """Diagnostic script to check Telegram session type."""
 
 import asyncio
+import faulthandler
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+from src.telegram_client import CRYPTG_AVAILABLE, TelegramContactManager
+from src.utils import install_uvloop
 
-from src.telegram_client import TelegramContactManager
-import json
+# orjson is optional; stdlib json.loads accepts the same bytes input
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 async def check_session():
     """Check if the session is a user or bot session."""
 
     # Load config
     try:
-        with open("telegram_config.json", 'r') as f:
-            config = json.load(f)
+        config = json_loads(Path("telegram_config.json").read_bytes())
     except FileNotFoundError:
         print("❌ No telegram_config.json found")
         return
@@ -28,13 +32,17 @@ async def check_session():
         print("❌ Missing API credentials in config")
         return
 
+    if not CRYPTG_AVAILABLE:
+        print("⚠️  cryptg is not installed - Telethon encryption will run in pure Python (much slower)")
+        print("   Install it with: pip install 'cryptg>=0.4.0'")
+
     manager = TelegramContactManager(api_id, api_hash)
 
     try:
         await manager.connect()
 
-        # Get current user info
-        me = await manager.client.get_me()
+        # Get current user info (connect() already fetched it when authorized)
+        me = manager.me or await manager.client.get_me()
 
         print("\n=== Session Information ===")
         print(f"User ID: {me.id}")
@@ -58,8 +66,10 @@ async def check_session():
 
     except Exception as e:
         print(f"❌ Error checking session: {e}")
-        import traceback
-        traceback.print_exc()
+        # The interpreter's own hook prints the traceback without importing traceback
+        sys.excepthook(*sys.exc_info())
 
 if __name__ == "__main__":
+    faulthandler.enable()
+    install_uvloop()
     asyncio.run(check_session())
@@ -2,24 +2,40 @@
 """Installation script for Telegram Contact Importer."""
 
 import os
+import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (argv list, or a string split with shlex) and handle errors."""
     print(f"📦 {description}...")
+    if isinstance(command, str):
+        command = shlex.split(command)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # No shell and close_fds=False lets CPython spawn via posix_spawn()
+        # instead of fork()+exec() on the (already large) installer process.
+        # stdout is discarded rather than buffered; only stderr is kept for errors.
+        result = subprocess.run(
+            command,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            close_fds=False,
+        )
+        if result.returncode != 0:
+            print(f"❌ {description} failed: exit status {result.returncode}")
+            if result.stderr:
+                print(f"stderr: {result.stderr}")
+            return False
         print(f"✅ {description} completed")
         return True
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
+        # Without a shell, a missing executable surfaces here instead of as exit 127
         print(f"❌ {description} failed: {e}")
-        if e.stdout:
-            print(f"stdout: {e.stdout}")
-        if e.stderr:
-            print(f"stderr: {e.stderr}")
         return False
 
 
@@ -40,7 +56,7 @@ def install_requirements():
         print("❌ requirements.txt not found")
         return False
     
-    command = f"{sys.executable} -m pip install -r requirements.txt"
+    command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
     return run_command(command, "Installing requirements")
 
 
@@ -53,10 +69,12 @@ def create_directories():
     ]
     
     for directory in directories:
-        path = Path(directory)
-        if not path.exists():
-            path.mkdir(exist_ok=True)
-            print(f"📁 Created directory: {directory}")
+        # Let mkdir report existence itself rather than stat-ing first
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            continue
+        print(f"📁 Created directory: {directory}")
     
     return True
 
@@ -72,28 +90,33 @@ def check_config():
         return True
 
 
+NEXT_STEPS = ("""
+""" + "=" * 60 + """
+🎉 Setup completed successfully!
+""" + "=" * 60 + """
+
+📋 Next Steps:
+1. Get Telegram API credentials:
+   - Visit: https://my.telegram.org/apps
+   - Create a new application
+   - Note your api_id and api_hash
+
+2. Run the application:
+   python main.py
+
+3. Follow the interactive setup to:
+   - Enter your API credentials
+   - Authenticate with your phone number
+   - Import your contacts
+
+📄 Sample data file is located at: src/data/HGCS12.txt
+📖 For more information, see README.md
+""")
+
+
 def print_next_steps():
     """Print next steps for the user."""
-    print("\n" + "="*60)
-    print("🎉 Setup completed successfully!")
-    print("="*60)
-    print("\n📋 Next Steps:")
-    print("1. Get Telegram API credentials:")
-    print("   - Visit: https://my.telegram.org/apps")
-    print("   - Create a new application")
-    print("   - Note your api_id and api_hash")
-    print()
-    print("2. Run the application:")
-    print("   python main.py")
-    print()
-    print("3. Follow the interactive setup to:")
-    print("   - Enter your API credentials")
-    print("   - Authenticate with your phone number")
-    print("   - Import your contacts")
-    print()
-    print("📄 Sample data file is located at: src/data/HGCS12.txt")
-    print("📖 For more information, see README.md")
-    print()
+    print(NEXT_STEPS)
 
 
 def main():
@@ -106,17 +129,21 @@ def main():
     if not check_python_version():
         sys.exit(1)
     
-    # Install requirements
-    if not install_requirements():
-        print("\n❌ Failed to install requirements")
-        print("Please run manually: pip install -r requirements.txt")
-        sys.exit(1)
-    
-    # Create directories
-    create_directories()
-    
-    # Check config
-    check_config()
+    # Install requirements in the background; the local setup steps don't
+    # depend on it and finish while pip is still downloading.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pip_future = executor.submit(install_requirements)
+        
+        # Create directories
+        create_directories()
+        
+        # Check config
+        check_config()
+        
+        if not pip_future.result():
+            print("\n❌ Failed to install requirements")
+            print("Please run manually: pip install -r requirements.txt")
+            sys.exit(1)
     
     # Print next steps
     print_next_steps()
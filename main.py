@@ -7,23 +7,25 @@ Usage:
     python main.py              # Run interactive CLI
     python main.py --help       # Show help
     python main.py --file path  # Quick import from file
+    python main.py preview path # Preview numbers (also: config, import path)
 """
 
-import argparse
-import asyncio
+import faulthandler
+import os
+import stat
 import sys
-from pathlib import Path
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-try:
-    from src.cli import ContactImporterCLI
-    from src.cli import main as cli_main
-    from src.config import config
-    from src.phone_parser import parse_phone_file
-    from src.utils import setup_logging
-except ImportError as e:
+from types import SimpleNamespace
+
+# The src modules pull in telethon, phonenumbers, tqdm, etc. They are imported
+# inside the command that needs them so e.g. --config doesn't pay for telethon.
+
+
+# Numbers parsed by quick_preview; enough for a representative country histogram
+PREVIEW_SAMPLE_LIMIT = 10_000
+
+
+def exit_on_import_error(e: ImportError):
+    """Report a missing dependency and exit."""
     print(f"Import error: {e}")
     print("Please ensure all dependencies are installed: pip install -r requirements.txt")
     sys.exit(1)
@@ -31,12 +33,19 @@ except ImportError as e:
 
 def quick_preview(file_path: str):
     """Quick preview of phone numbers in a file."""
+    try:
+        from src.phone_parser import parse_phone_file, sample_numbers
+    except ImportError as e:
+        exit_on_import_error(e)
+    
     print(f"📄 Quick Preview: {file_path}")
     print("=" * 50)
     
     try:
-        phone_numbers, stats = parse_phone_file(file_path)
+        phone_numbers, stats = parse_phone_file(file_path, limit=PREVIEW_SAMPLE_LIMIT)
         
+        if stats['total'] >= PREVIEW_SAMPLE_LIMIT:
+            print(f"(first {PREVIEW_SAMPLE_LIMIT} numbers sampled)")
         print(f"Total numbers found: {stats['total']}")
         print(f"Valid numbers: {stats['valid']}")
         print(f"Invalid numbers: {stats['invalid']}")
@@ -44,28 +53,31 @@ def quick_preview(file_path: str):
         
         if stats['country_codes']:
             print("\nCountry codes detected:")
-            for code, count in stats['country_codes'].items():
-                print(f"  {code}: {count} numbers")
+            sys.stdout.write("".join(
+                f"  {code}: {count} numbers\n" for code, count in stats['country_codes'].items()
+            ))
+        
+        valid_head, invalid_head = sample_numbers(phone_numbers)
         
         # Show sample numbers
-        valid_numbers = [p for p in phone_numbers if p.is_valid]
-        if valid_numbers:
+        if valid_head:
             print(f"\n✅ Sample valid numbers:")
-            for i, phone in enumerate(valid_numbers[:5]):
-                print(f"  {i+1}. {phone.raw} → {phone.formatted}")
+            sys.stdout.write("".join(
+                f"  {i+1}. {phone.raw} → {phone.formatted}\n" for i, phone in enumerate(valid_head)
+            ))
             
-            if len(valid_numbers) > 5:
-                print(f"  ... and {len(valid_numbers) - 5} more")
+            if stats['valid'] > 5:
+                print(f"  ... and {stats['valid'] - 5} more")
         
         # Show invalid numbers if any
-        invalid_numbers = [p for p in phone_numbers if not p.is_valid]
-        if invalid_numbers:
+        if invalid_head:
             print(f"\n⚠️  Sample invalid numbers:")
-            for i, phone in enumerate(invalid_numbers[:3]):
-                print(f"  {i+1}. {phone.raw} - {phone.error_message}")
+            sys.stdout.write("".join(
+                f"  {i+1}. {phone.raw} - {phone.error_message}\n" for i, phone in enumerate(invalid_head)
+            ))
             
-            if len(invalid_numbers) > 3:
-                print(f"  ... and {len(invalid_numbers) - 3} more")
+            if stats['invalid'] > 3:
+                print(f"  ... and {stats['invalid'] - 3} more")
     
     except Exception as e:
         print(f"❌ Error parsing file: {e}")
@@ -74,9 +86,7 @@ def quick_preview(file_path: str):
     return True
 
 
-def print_banner():
-    """Print application banner."""
-    banner = """
+BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║             📱 Telegram Contact Importer CLI                ║
@@ -88,66 +98,198 @@ def print_banner():
 ║  • Skip existing contacts automatically                     ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
-"""
-    print(banner)
+
+""".encode("utf-8")
+
+REQUIREMENTS = """\
+📋 Setup Requirements:
+1. Telegram API credentials (api_id and api_hash)
+   - Get them from: https://my.telegram.org/apps
+2. Your phone number registered with Telegram
+3. Text file with phone numbers (one per line)
+
+📁 Sample file format:
+   821020131384
+   821020102136
+   +852 1234 5678
+   ...
+
+""".encode("utf-8")
+
+
+def write_block(block: bytes):
+    """Write a pre-encoded UTF-8 text block to stdout."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+    if buffer is None or encoding != "utf8":
+        sys.stdout.write(block.decode("utf-8"))
+        return
+    
+    # Flush pending text first so the bytes land after earlier prints
+    sys.stdout.flush()
+    buffer.write(block)
+
+
+def print_banner():
+    """Print application banner."""
+    write_block(BANNER)
 
 
 def print_requirements():
     """Print setup requirements."""
-    print("📋 Setup Requirements:")
-    print("1. Telegram API credentials (api_id and api_hash)")
-    print("   - Get them from: https://my.telegram.org/apps")
-    print("2. Your phone number registered with Telegram")
-    print("3. Text file with phone numbers (one per line)")
-    print()
-    print("📁 Sample file format:")
-    print("   821020131384")
-    print("   821020102136")
-    print("   +852 1234 5678")
-    print("   ...")
-    print()
+    write_block(REQUIREMENTS)
 
 
 def validate_file(file_path: str) -> bool:
     """Validate that file exists and is readable."""
-    path = Path(file_path)
-    
-    if not path.exists():
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         print(f"❌ File not found: {file_path}")
         return False
+    except OSError as e:
+        print(f"❌ Cannot read file: {e}")
+        return False
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         print(f"❌ Path is not a file: {file_path}")
         return False
     
+    # A zero-byte file needs no read; otherwise peek at the first block raw
+    # to catch whitespace-only files without building a text IO stack.
     try:
-        with open(path, 'r') as f:
-            first_line = f.readline().strip()
-            if not first_line:
-                print(f"⚠️  File appears to be empty: {file_path}")
-                return False
-    except Exception as e:
+        if st.st_size:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                head = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+        else:
+            head = b""
+    except OSError as e:
         print(f"❌ Cannot read file: {e}")
         return False
     
+    if not head.strip():
+        print(f"⚠️  File appears to be empty: {file_path}")
+        return False
+    
     return True
 
 
-def main():
-    """Main entry point with command line argument parsing."""
+def cmd_config(args):
+    """Show the current configuration and any session files."""
+    try:
+        from src.config import config
+    except ImportError as e:
+        exit_on_import_error(e)
+    
+    print_banner()
+    print("⚙️  Current Configuration:")
+    print("-" * 30)
+    print(f"Default country: {config.get('defaults.country_code', 'Not set')}")
+    print(f"Phone formatting: {config.get_phone_formatting()}")
+    print(f"Validation settings: {config.get_validation()}")
+    print(f"Logging: {config.get_logging()}")
+    
+    # Check for session files (one directory pass for both patterns)
+    session_files, config_files = [], []
+    with os.scandir(os.getcwd()) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".session"):
+                session_files.append(entry.path)
+            elif name.startswith("telegram_") and name.endswith(".json"):
+                config_files.append(entry.path)
+    
+    print(f"\n📁 Session Files:")
+    if session_files:
+        for f in session_files:
+            print(f"  ✅ {f}")
+    else:
+        print(f"  ❌ No session files found")
+    
+    if config_files:
+        for f in config_files:
+            print(f"  ✅ {f}")
+
+
+def cmd_preview(args):
+    """Preview the phone numbers in a file without importing them."""
+    if not validate_file(args.preview):
+        sys.exit(1)
+    
+    print_banner()
+    success = quick_preview(args.preview)
+    sys.exit(0 if success else 1)
+
+
+def cmd_import(args):
+    """Start the interactive CLI with an import file pre-selected."""
+    if not validate_file(args.file):
+        sys.exit(1)
+    
+    print_banner()
+    print(f"🚀 Quick Import Mode")
+    print(f"File: {args.file}")
+    print()
+    print("Note: This will start the interactive CLI with the file pre-selected.")
+    print("You'll need to authenticate with Telegram first.")
+    print()
+    
+    # Set the file for the CLI to use
+    os.environ['CONTACT_IMPORTER_FILE'] = args.file
+    
+    cmd_interactive(args)
+
+
+def cmd_interactive(args):
+    """Run the interactive CLI."""
+    if not args.quiet:
+        print_banner()
+        if not args.file:
+            print_requirements()
+    
+    try:
+        from src.cli import main as cli_main
+        from src.utils import install_uvloop
+    except ImportError as e:
+        exit_on_import_error(e)
+    
+    install_uvloop()
+    
+    try:
+        # Run the interactive CLI
+        cli_main()
+    except KeyboardInterrupt:
+        print("\n👋 Goodbye!")
+    except Exception as e:
+        print(f"❌ Fatal error: {e}")
+        if args.verbose:
+            # The interpreter's own hook prints the traceback without importing traceback
+            sys.excepthook(*sys.exc_info())
+        sys.exit(1)
+
+
+def parse_args():
+    """Build the argument parser and parse sys.argv."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Telegram Contact Importer - Bulk import phone numbers to Telegram",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   python main.py                           # Run interactive CLI
-  python main.py --preview data.txt       # Preview numbers in file
-  python main.py --file data.txt          # Quick import from file
-  python main.py --config                 # Show configuration
+  python main.py preview data.txt         # Preview numbers in file
+  python main.py import data.txt          # Quick import from file
+  python main.py config                   # Show configuration
   
+The --preview, --file and --config options are kept as aliases.
 For first-time setup, run without arguments to use the interactive CLI.
         """
     )
+    parser.set_defaults(func=cmd_interactive)
     
     parser.add_argument(
         '--file', '-f',
@@ -185,81 +327,56 @@ For first-time setup, run without arguments to use the interactive CLI.
         help='Specify log file path'
     )
     
-    args = parser.parse_args()
+    subparsers = parser.add_subparsers(title='commands', metavar='COMMAND')
     
-    # Setup logging
-    log_level = "DEBUG" if args.verbose else "ERROR" if args.quiet else "INFO"
-    setup_logging(level=log_level, log_file=args.log_file, console=not args.quiet)
+    config_parser = subparsers.add_parser('config', help='Show current configuration')
+    config_parser.set_defaults(func=cmd_config)
     
-    # Handle different command modes
-    if args.config:
-        print_banner()
-        print("⚙️  Current Configuration:")
-        print("-" * 30)
-        print(f"Default country: {config.get('defaults.country_code', 'Not set')}")
-        print(f"Phone formatting: {config.get_phone_formatting()}")
-        print(f"Validation settings: {config.get_validation()}")
-        print(f"Logging: {config.get_logging()}")
-        
-        # Check for session files
-        session_files = list(Path.cwd().glob("*.session"))
-        config_files = list(Path.cwd().glob("telegram_*.json"))
-        
-        print(f"\n📁 Session Files:")
-        if session_files:
-            for f in session_files:
-                print(f"  ✅ {f}")
-        else:
-            print(f"  ❌ No session files found")
-        
-        if config_files:
-            for f in config_files:
-                print(f"  ✅ {f}")
-        
-        return
+    preview_parser = subparsers.add_parser('preview', help='Preview phone numbers in file without importing')
+    preview_parser.add_argument('preview', metavar='FILE', help='Phone numbers file to preview')
+    preview_parser.set_defaults(func=cmd_preview)
     
-    if args.preview:
-        if not validate_file(args.preview):
-            sys.exit(1)
-        
-        print_banner()
-        success = quick_preview(args.preview)
-        sys.exit(0 if success else 1)
+    import_parser = subparsers.add_parser('import', help='Import phone numbers from file')
+    import_parser.add_argument('file', metavar='FILE', help='Phone numbers file to import')
+    import_parser.set_defaults(func=cmd_import)
     
-    if args.file:
-        if not validate_file(args.file):
-            sys.exit(1)
-        
-        print_banner()
-        print(f"🚀 Quick Import Mode")
-        print(f"File: {args.file}")
-        print()
-        print("Note: This will start the interactive CLI with the file pre-selected.")
-        print("You'll need to authenticate with Telegram first.")
-        print()
-        
-        # Set the file for the CLI to use
-        import os
-        os.environ['CONTACT_IMPORTER_FILE'] = args.file
+    args = parser.parse_args()
     
-    # Default: Run interactive CLI
-    if not args.quiet:
-        print_banner()
-        if not (args.file or args.preview or args.config):
-            print_requirements()
+    # Map the option-style aliases onto their commands
+    if args.func is cmd_interactive:
+        if args.config:
+            args.func = cmd_config
+        elif args.preview:
+            args.func = cmd_preview
+        elif args.file:
+            args.func = cmd_import
+    
+    return args
+
+
+def main():
+    """Main entry point with command line argument parsing."""
+    if len(sys.argv) == 1:
+        # Plain `python main.py` is the common case; it needs no parser
+        args = SimpleNamespace(
+            file=None, preview=None, config=False, verbose=False,
+            quiet=False, log_file=None, func=cmd_interactive
+        )
+    else:
+        args = parse_args()
     
     try:
-        # Run the interactive CLI
-        cli_main()
-    except KeyboardInterrupt:
-        print("\n👋 Goodbye!")
-    except Exception as e:
-        print(f"❌ Fatal error: {e}")
-        if args.verbose:
-            import traceback
-            traceback.print_exc()
-        sys.exit(1)
+        from src.utils import setup_logging
+    except ImportError as e:
+        exit_on_import_error(e)
+    
+    # Setup logging
+    log_level = "DEBUG" if args.verbose else "ERROR" if args.quiet else "INFO"
+    setup_logging(level=log_level, log_file=args.log_file, console=not args.quiet)
+    
+    args.func(args)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    faulthandler.enable()
+    main()
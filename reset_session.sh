@@ -14,7 +14,7 @@ fi
 
 echo ""
 echo "Removing session files..."
-rm -f *.session
+rm -f *.session *.session-wal *.session-shm
 rm -f telegram_config.json
 
 echo "✅ Session files removed"
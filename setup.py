@@ -18,12 +18,11 @@ else:
 # Parse requirements.txt
 requirements_file = Path(__file__).parent / "requirements.txt"
 if requirements_file.exists():
-    with open(requirements_file, "r", encoding="utf-8") as fh:
-        requirements = [
-            line.strip() 
-            for line in fh 
-            if line.strip() and not line.startswith("#")
-        ]
+    requirements = [
+        line.strip()
+        for line in requirements_file.read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
 else:
     requirements = [
         "click>=8.0.0",
@@ -33,6 +32,7 @@ else:
         "colorama>=0.4.4",
         "telethon>=1.30.0",
         "cryptg>=0.4.0",
+        "uvloop>=0.17.0; platform_system != 'Windows'",
         "openpyxl>=3.1.0",
         "vobject>=0.9.6",
     ]
@@ -62,6 +62,8 @@ setup(
         "Documentation": "https://github.com/Domains18/ct226/blob/main/README.md",
     },
     packages=find_packages(exclude=["tests", "tests.*"]),
+    # main.py lives at the top level; ship it so the console scripts resolve
+    py_modules=["main"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -6,122 +6,185 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 try:
     import click
     from colorama import Fore, Style
     from colorama import init as colorama_init
-    from tqdm import tqdm
 except ImportError:
     print("Required packages not installed. Please run: pip install -r requirements.txt")
     sys.exit(1)
 
+# orjson is optional; both variants read and write compact UTF-8 JSON bytes
+try:
+    from orjson import dumps as json_dumps_bytes
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+    
+    def json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 from .config import config
 from .contact_manager import ContactManager, create_contact_manager
-from .phone_parser import parse_phone_file
-from .telegram_client import TelegramAuth, TelegramContactManager
+from .phone_parser import count_lines, preview_phone_file
+from .telegram_client import DEFAULT_SESSION_NAME, MAX_IMPORT_CONTACTS, TelegramAuth, TelegramContactManager
+from .utils import ProgressTracker, run_blocking, start_log_listener
 from .vcf_exporter import VCFExporter
 
 # Initialize colorama for cross-platform colored output
 colorama_init()
 
+# Directory scanned for phone number files
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Colour codes and common prefixes, resolved once instead of on every print
+RED, GREEN, YELLOW, CYAN = Fore.RED, Fore.GREEN, Fore.YELLOW, Fore.CYAN
+RESET = Style.RESET_ALL
+ERROR = RED + "❌ "
+SUCCESS = GREEN + "✅ "
+
+HEADER = (
+    f"\n{CYAN}{'='*60}\n"
+    f"{CYAN}  📱 Telegram Contact Importer CLI\n"
+    f"{CYAN}  Bulk import phone numbers to your Telegram account\n"
+    f"{CYAN}{'='*60}{RESET}\n"
+)
+
+MENU = (
+    f"{GREEN}📋 Main Menu:{RESET}\n"
+    "1. 🔐 Setup/Login to Telegram\n"
+    "2. 📄 Preview phone numbers from file\n"
+    "3. 📲 Import contacts from file (via Telegram API)\n"
+    "4. 📇 Export to VCF file (import to phone contacts)\n"
+    "5. ➕ Add single contact\n"
+    "6. 📊 View import statistics\n"
+    "7. ⚙️  Configuration\n"
+    "8. 🚪 Exit\n"
+)
+
+BOT_SESSION_HELP = (
+    f"\n{YELLOW}{'='*60}{RESET}\n"
+    f"{YELLOW}⚠️  BOT SESSION DETECTED!{RESET}\n"
+    f"{YELLOW}{'='*60}{RESET}\n"
+    f"\n{RED}Your session is using BOT credentials.{RESET}\n"
+    f"{RED}Telegram does NOT allow bots to add contacts.{RESET}\n"
+    f"\n{CYAN}To fix this:{RESET}\n"
+    f"{CYAN}1. Run: ./reset_session.sh{RESET}\n"
+    f"{CYAN}2. Restart: python main.py{RESET}\n"
+    f"{CYAN}3. Use USER credentials from https://my.telegram.org/apps{RESET}\n"
+    f"{CYAN}   (NOT bot tokens from @BotFather){RESET}\n"
+    f"{YELLOW}{'='*60}{RESET}\n"
+)
+
 
 class ContactImporterCLI:
     """Interactive CLI for the contact importer."""
     
     def __init__(self):
+        self.log_listener = None
         self.setup_logging()
         self.contact_manager: Optional[ContactManager] = None
         self.config_file = "telegram_config.json"
         self.session_data = self.load_session_data()
+        # (data dir mtime, sorted .txt paths) from the last get_data_files scan
+        self._data_files_cache: Optional[Tuple[int, List[str]]] = None
+        # (cwd, cwd mtime, first *.session path) from the last get_session_file scan
+        self._session_file_cache: Optional[Tuple[str, int, Optional[str]]] = None
     
     def setup_logging(self):
         """Setup logging configuration."""
+        # basicConfig() ignores us if logging was already configured (e.g. by main.py)
+        if logging.getLogger().handlers:
+            return
+        
         log_config = config.get_logging()
         level = getattr(logging, log_config.get('level', 'INFO'))
         
+        # The real handlers run on a listener thread so log calls don't block the event loop
+        queue_handler, self.log_listener = start_log_listener(
+            logging.FileHandler(log_config.get('log_file', 'contact_importer.log')),
+            logging.StreamHandler() if log_config.get('console_output', True) else logging.NullHandler()
+        )
+        
         logging.basicConfig(
             level=level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_config.get('log_file', 'contact_importer.log')),
-                logging.StreamHandler() if log_config.get('console_output', True) else logging.NullHandler()
-            ]
+            handlers=[queue_handler]
         )
     
     def load_session_data(self) -> dict:
         """Load saved session data."""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {}
+        try:
+            return json_loads(Path(self.config_file).read_bytes())
+        except Exception:
+            return {}
     
     def save_session_data(self, data: dict):
-        """Save session data."""
+        """Save session data.
+        
+        Written to a temporary file and renamed into place, so an interrupted
+        save never leaves a truncated config behind.
+        """
+        tmp_file = f"{self.config_file}.tmp"
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(json_dumps_bytes(data))
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
-            print(f"{Fore.YELLOW}Warning: Could not save session data: {e}{Style.RESET_ALL}")
+            print(f"{YELLOW}Warning: Could not save session data: {e}{RESET}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
     
     def print_header(self):
         """Print application header."""
-        print(f"\n{Fore.CYAN}{'='*60}")
-        print(f"{Fore.CYAN}  📱 Telegram Contact Importer CLI")
-        print(f"{Fore.CYAN}  Bulk import phone numbers to your Telegram account")
-        print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
+        print(HEADER)
     
     def print_menu(self):
         """Print main menu."""
-        print(f"{Fore.GREEN}📋 Main Menu:{Style.RESET_ALL}")
-        print("1. 🔐 Setup/Login to Telegram")
-        print("2. 📄 Preview phone numbers from file")
-        print("3. 📲 Import contacts from file (via Telegram API)")
-        print("4. 📇 Export to VCF file (import to phone contacts)")
-        print("5. ➕ Add single contact")
-        print("6. 📊 View import statistics")
-        print("7. ⚙️  Configuration")
-        print("8. 🚪 Exit")
-        print()
+        print(MENU)
+    
+    async def _ainput(self, prompt: str = "") -> str:
+        """input() that leaves the event loop running while the user types."""
+        return await run_blocking(input, prompt)
     
     async def setup_telegram_auth(self):
         """Setup Telegram authentication."""
-        print(f"{Fore.YELLOW}🔐 Telegram Authentication Setup{Style.RESET_ALL}")
+        print(f"{YELLOW}🔐 Telegram Authentication Setup{RESET}")
         print()
         
         # Check if we have saved credentials
         if self.session_data.get('api_id') and self.session_data.get('api_hash'):
-            use_saved = input(f"Use saved API credentials? (y/n): ").strip().lower()
+            use_saved = (await self._ainput(f"Use saved API credentials? (y/n): ")).strip().lower()
             if use_saved == 'y':
                 api_id = self.session_data['api_id']
                 api_hash = self.session_data['api_hash']
             else:
-                api_id, api_hash = TelegramAuth.get_api_credentials_from_user()
+                api_id, api_hash = await run_blocking(TelegramAuth.get_api_credentials_from_user)
         else:
-            api_id, api_hash = TelegramAuth.get_api_credentials_from_user()
+            api_id, api_hash = await run_blocking(TelegramAuth.get_api_credentials_from_user)
         
         if not api_id or not api_hash:
-            print(f"{Fore.RED}❌ API credentials are required!{Style.RESET_ALL}")
+            print(f"{ERROR}API credentials are required!{RESET}")
             return False
         
         # Get phone number
-        phone_number = input("Enter your phone number (with country code, e.g., +1234567890): ").strip()
+        phone_number = (await self._ainput("Enter your phone number (with country code, e.g., +1234567890): ")).strip()
         if not phone_number:
-            print(f"{Fore.RED}❌ Phone number is required!{Style.RESET_ALL}")
+            print(f"{ERROR}Phone number is required!{RESET}")
             return False
         
-        print(f"{Fore.YELLOW}Connecting to Telegram...{Style.RESET_ALL}")
+        print(f"{YELLOW}Connecting to Telegram...{RESET}")
         
         try:
             # Create contact manager with authentication
             self.contact_manager = await create_contact_manager(api_id, api_hash, phone_number)
             
             if self.contact_manager:
-                print(f"{Fore.GREEN}✅ Successfully connected to Telegram!{Style.RESET_ALL}")
+                print(f"{SUCCESS}Successfully connected to Telegram!{RESET}")
                 
                 # Save credentials for future use
                 self.session_data.update({
@@ -130,67 +193,122 @@ class ContactImporterCLI:
                     'phone_number': phone_number
                 })
                 self.save_session_data(self.session_data)
+                # A new .session file may exist now
+                self._session_file_cache = None
                 
                 return True
             else:
-                print(f"{Fore.RED}❌ Failed to connect to Telegram{Style.RESET_ALL}")
+                print(f"{ERROR}Failed to connect to Telegram{RESET}")
                 return False
                 
         except Exception as e:
-            print(f"{Fore.RED}❌ Authentication failed: {e}{Style.RESET_ALL}")
+            print(f"{ERROR}Authentication failed: {e}{RESET}")
             return False
     
     def get_data_files(self) -> list:
-        """Get all .txt files from the data directory."""
-        data_dir = Path(__file__).parent.parent / "data"
-        if data_dir.exists():
-            return sorted([str(f) for f in data_dir.glob("*.txt")])
-        return []
-
-    def preview_phone_numbers(self):
-        """Preview phone numbers from file."""
-        print(f"{Fore.YELLOW}📄 Preview Phone Numbers{Style.RESET_ALL}")
-        print()
+        """Get all .txt files from the data directory.
+        
+        The listing is cached and only rescanned when the directory's mtime
+        changes, i.e. when files are added, removed or renamed.
+        """
+        data_dir = DATA_DIR
+        try:
+            mtime = data_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        
+        if self._data_files_cache and self._data_files_cache[0] == mtime:
+            return list(self._data_files_cache[1])
+        
+        # Name check first; is_file() is answered from d_type for non-symlinks
+        with os.scandir(data_dir) as entries:
+            data_files = [entry.path for entry in entries
+                          if entry.name.endswith(".txt") and entry.is_file()]
+        data_files.sort()
+        self._data_files_cache = (mtime, data_files)
+        return list(data_files)
+
+    def get_session_file(self) -> Optional[str]:
+        """Get the first *.session file in the working directory, if any.
+        
+        The session file the client itself uses is checked with a single
+        stat; only if it is missing is the directory scanned for others,
+        cached like get_data_files and keyed on the directory's mtime.
+        """
+        if self.contact_manager:
+            session_path = str(self.contact_manager.telegram_manager.session_path)
+        else:
+            session_path = os.path.join(os.getcwd(), f"{DEFAULT_SESSION_NAME}.session")
+        if os.path.isfile(session_path):
+            return session_path
+        
+        cwd = os.getcwd()
+        try:
+            mtime = os.stat(cwd).st_mtime_ns
+        except OSError:
+            return None
+        
+        cache = self._session_file_cache
+        if cache and cache[0] == cwd and cache[1] == mtime:
+            return cache[2]
+        
+        session_file = None
+        with os.scandir(cwd) as entries:
+            for entry in entries:
+                if entry.name.endswith(".session"):
+                    session_file = entry.path
+                    break
+        self._session_file_cache = (cwd, mtime, session_file)
+        return session_file
 
+    def _choose_file(self, default_file: str = "data/HGCS12.txt") -> str:
+        """Let the user pick a data file by number or enter a custom path."""
         # Get available files from data directory
         data_files = self.get_data_files()
 
-        if data_files:
-            print(f"{Fore.GREEN}Available files in data directory:{Style.RESET_ALL}")
-            for i, file_path in enumerate(data_files, 1):
-                print(f"  {i}. {Path(file_path).name}")
-            print()
-
-            file_choice = input(f"Enter file number (1-{len(data_files)}) or custom path: ").strip()
-
-            # Check if user entered a number
-            try:
-                choice_num = int(file_choice)
-                if 1 <= choice_num <= len(data_files):
-                    file_path = data_files[choice_num - 1]
-                else:
-                    print(f"{Fore.YELLOW}Invalid number, using first file{Style.RESET_ALL}")
-                    file_path = data_files[0]
-            except ValueError:
-                # User entered a custom path
-                file_path = file_choice if file_choice else data_files[0]
-        else:
+        if not data_files:
             # Fallback to manual entry
-            default_file = "data/HGCS12.txt"
             file_path = input(f"Enter file path (default: {default_file}): ").strip()
-            if not file_path:
-                file_path = default_file
+            return file_path or default_file
+
+        print(f"{GREEN}Available files in data directory:{RESET}")
+        for i, file_path in enumerate(data_files, 1):
+            print(f"  {i}. {Path(file_path).name}")
+        print()
+
+        file_choice = input(f"Enter file number (1-{len(data_files)}) or custom path: ").strip()
+
+        if not file_choice:
+            return data_files[0]
+
+        if not file_choice.isdigit():
+            # User entered a custom path
+            return file_choice
+
+        choice_num = int(file_choice)
+        if 1 <= choice_num <= len(data_files):
+            return data_files[choice_num - 1]
+
+        print(f"{YELLOW}Invalid number, using first file{RESET}")
+        return data_files[0]
+
+    def preview_phone_numbers(self):
+        """Preview phone numbers from file."""
+        print(f"{YELLOW}📄 Preview Phone Numbers{RESET}")
+        print()
+
+        file_path = self._choose_file()
         
         if not os.path.exists(file_path):
-            print(f"{Fore.RED}❌ File not found: {file_path}{Style.RESET_ALL}")
+            print(f"{ERROR}File not found: {file_path}{RESET}")
             return
         
         try:
-            print(f"{Fore.YELLOW}Parsing phone numbers...{Style.RESET_ALL}")
-            phone_numbers, stats = parse_phone_file(file_path)
+            print(f"{YELLOW}Parsing phone numbers...{RESET}")
+            valid_sample, invalid_sample, stats = preview_phone_file(file_path)
             
             # Display statistics
-            print(f"\n{Fore.GREEN}📊 File Statistics:{Style.RESET_ALL}")
+            print(f"\n{GREEN}📊 File Statistics:{RESET}")
             print(f"Total numbers found: {stats['total']}")
             print(f"Valid numbers: {stats['valid']}")
             print(f"Invalid numbers: {stats['invalid']}")
@@ -202,179 +320,147 @@ class ContactImporterCLI:
                     print(f"  {code}: {count} numbers")
             
             # Show sample numbers
-            valid_numbers = [p for p in phone_numbers if p.is_valid]
-            if valid_numbers:
-                print(f"\n{Fore.GREEN}✅ Sample valid numbers:{Style.RESET_ALL}")
-                for i, phone in enumerate(valid_numbers[:5]):
+            if valid_sample:
+                print(f"\n{SUCCESS}Sample valid numbers:{RESET}")
+                for i, phone in enumerate(valid_sample):
                     print(f"  {i+1}. {phone.raw} → {phone.formatted}")
                 
-                if len(valid_numbers) > 5:
-                    print(f"  ... and {len(valid_numbers) - 5} more")
+                if stats['valid'] > 5:
+                    print(f"  ... and {stats['valid'] - 5} more")
             
             # Show invalid numbers if any
-            invalid_numbers = [p for p in phone_numbers if not p.is_valid]
-            if invalid_numbers:
-                print(f"\n{Fore.YELLOW}⚠️  Sample invalid numbers:{Style.RESET_ALL}")
-                for i, phone in enumerate(invalid_numbers[:3]):
+            if invalid_sample:
+                print(f"\n{YELLOW}⚠️  Sample invalid numbers:{RESET}")
+                for i, phone in enumerate(invalid_sample):
                     print(f"  {i+1}. {phone.raw} - {phone.error_message}")
                 
-                if len(invalid_numbers) > 3:
-                    print(f"  ... and {len(invalid_numbers) - 3} more")
+                if stats['invalid'] > 3:
+                    print(f"  ... and {stats['invalid'] - 3} more")
         
         except Exception as e:
-            print(f"{Fore.RED}❌ Error parsing file: {e}{Style.RESET_ALL}")
+            print(f"{ERROR}Error parsing file: {e}{RESET}")
     
     async def import_contacts_from_file(self, auto_file_path: Optional[str] = None):
         """Import contacts from file."""
         if not self.contact_manager:
-            print(f"{Fore.RED}❌ Please setup Telegram authentication first!{Style.RESET_ALL}")
+            print(f"{ERROR}Please setup Telegram authentication first!{RESET}")
             return
 
-        print(f"{Fore.YELLOW}📲 Import Contacts from File{Style.RESET_ALL}")
+        print(f"{YELLOW}📲 Import Contacts from File{RESET}")
         print()
 
         # Use auto file path if provided
         if auto_file_path:
             file_path = auto_file_path
-            print(f"{Fore.GREEN}Auto-importing from: {file_path}{Style.RESET_ALL}")
+            print(f"{GREEN}Auto-importing from: {file_path}{RESET}")
         else:
-            # Get available files from data directory
-            data_files = self.get_data_files()
-
-            if data_files:
-                print(f"{Fore.GREEN}Available files in data directory:{Style.RESET_ALL}")
-                for i, file_path in enumerate(data_files, 1):
-                    print(f"  {i}. {Path(file_path).name}")
-                print()
-
-                file_choice = input(f"Enter file number (1-{len(data_files)}) or custom path: ").strip()
-
-                # Check if user entered a number
-                try:
-                    choice_num = int(file_choice)
-                    if 1 <= choice_num <= len(data_files):
-                        file_path = data_files[choice_num - 1]
-                    else:
-                        print(f"{Fore.YELLOW}Invalid number, using first file{Style.RESET_ALL}")
-                        file_path = data_files[0]
-                except ValueError:
-                    # User entered a custom path
-                    file_path = file_choice if file_choice else data_files[0]
-            else:
-                # Fallback to manual entry
-                default_file = "data/HGCS12.txt"
-                file_path = input(f"Enter file path (default: {default_file}): ").strip()
-                if not file_path:
-                    file_path = default_file
+            file_path = await run_blocking(self._choose_file)
         
         if not os.path.exists(file_path):
-            print(f"{Fore.RED}❌ File not found: {file_path}{Style.RESET_ALL}")
+            print(f"{ERROR}File not found: {file_path}{RESET}")
             return
         
         # Get import options
-        skip_existing = input("Skip existing contacts? (y/n, default: y): ").strip().lower()
+        skip_existing = (await self._ainput("Skip existing contacts? (y/n, default: y): ")).strip().lower()
         skip_existing = skip_existing != 'n'
 
-        # Set batch size to 20 by default (removed user input)
-        batch_size = 20
+        # One ImportContactsRequest per batch; Telegram takes up to MAX_IMPORT_CONTACTS
+        batch_size = MAX_IMPORT_CONTACTS
 
-        name_prefix = input("Contact name prefix (default: 'Contact'): ").strip()
+        name_prefix = (await self._ainput("Contact name prefix (default: 'Contact'): ")).strip()
         if not name_prefix:
             name_prefix = "Contact"
 
         # Confirm import
-        print(f"\n{Fore.YELLOW}Import Settings:{Style.RESET_ALL}")
+        print(f"\n{YELLOW}Import Settings:{RESET}")
         print(f"File: {file_path}")
         print(f"Skip existing: {skip_existing}")
         print(f"Batch size: {batch_size} (auto)")
         print(f"Name prefix: {name_prefix}")
         
-        confirm = input(f"\nProceed with import? (y/n): ").strip().lower()
+        confirm = (await self._ainput(f"\nProceed with import? (y/n): ")).strip().lower()
         if confirm != 'y':
             print("Import cancelled.")
             return
         
         try:
-            print(f"\n{Fore.YELLOW}Starting import...{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}All contacts will be prefixed with: '{name_prefix}'{Style.RESET_ALL}")
+            print(f"\n{YELLOW}Starting import...{RESET}")
+            print(f"{CYAN}All contacts will be prefixed with: '{name_prefix}'{RESET}")
 
-            with tqdm(desc="Importing contacts", unit="contact") as pbar:
+            # The line count is an upper bound (invalid and existing numbers
+            # are dropped), so the total is trimmed to the real count at the end
+            tracker = ProgressTracker(count_lines(file_path), "Importing contacts")
+            try:
                 result = await self.contact_manager.import_from_file(
                     file_path=file_path,
                     skip_existing=skip_existing,
                     batch_size=batch_size,
-                    name_prefix=name_prefix
+                    name_prefix=name_prefix,
+                    progress_callback=tracker.update_many
                 )
-                pbar.update(result['stats'].get('attempted', 0))
+            finally:
+                tracker.pbar.total = tracker.pbar.n
+                tracker.finish()
             
             # Display results
             if result['success']:
                 stats = result['stats']
-                print(f"\n{Fore.GREEN}✅ Import completed!{Style.RESET_ALL}")
+                print(f"\n{SUCCESS}Import completed!{RESET}")
                 print(f"Attempted: {stats.get('attempted', 0)}")
                 print(f"Successful: {stats.get('successful', 0)}")
                 print(f"Failed: {stats.get('failed', 0)}")
+                print(f"Skipped (already contacts): {stats.get('skipped', 0)}")
                 print(f"Success rate: {stats.get('success_rate', 0):.1f}%")
                 
                 if result.get('errors'):
-                    print(f"\n{Fore.YELLOW}Errors encountered:{Style.RESET_ALL}")
+                    print(f"\n{YELLOW}Errors encountered:{RESET}")
                     for error in result['errors'][:5]:
                         print(f"  • {error}")
                     if len(result['errors']) > 5:
                         print(f"  ... and {len(result['errors']) - 5} more")
             else:
-                print(f"\n{Fore.RED}❌ Import failed: {result.get('error', 'Unknown error')}{Style.RESET_ALL}")
+                print(f"\n{ERROR}Import failed: {result.get('error', 'Unknown error')}{RESET}")
         
         except Exception as e:
-            print(f"{Fore.RED}❌ Import error: {e}{Style.RESET_ALL}")
+            print(f"{ERROR}Import error: {e}{RESET}")
     
     async def add_single_contact(self):
         """Add a single contact."""
         if not self.contact_manager:
-            print(f"{Fore.RED}❌ Please setup Telegram authentication first!{Style.RESET_ALL}")
+            print(f"{ERROR}Please setup Telegram authentication first!{RESET}")
             return
 
         # Check if telegram manager is still connected
         if not self.contact_manager.telegram_manager.client or not self.contact_manager.telegram_manager.client.is_connected():
-            print(f"{Fore.RED}❌ Connection lost! Attempting to reconnect...{Style.RESET_ALL}")
+            print(f"{ERROR}Connection lost! Attempting to reconnect...{RESET}")
             try:
                 result = await self.contact_manager.telegram_manager.connect()
                 if not result:
                     raise Exception("Reconnection failed")
-                print(f"{Fore.GREEN}✅ Reconnected{Style.RESET_ALL}")
+                print(f"{SUCCESS}Reconnected{RESET}")
             except Exception as e:
                 error_msg = str(e)
-                print(f"{Fore.RED}❌ Reconnection failed: {error_msg}{Style.RESET_ALL}")
+                print(f"{ERROR}Reconnection failed: {error_msg}{RESET}")
 
                 if "bot" in error_msg.lower():
-                    print(f"\n{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
-                    print(f"{Fore.YELLOW}⚠️  BOT SESSION DETECTED!{Style.RESET_ALL}")
-                    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}")
-                    print(f"\n{Fore.RED}Your session is using BOT credentials.{Style.RESET_ALL}")
-                    print(f"{Fore.RED}Telegram does NOT allow bots to add contacts.{Style.RESET_ALL}")
-                    print(f"\n{Fore.CYAN}To fix this:{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}1. Run: ./reset_session.sh{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}2. Restart: python main.py{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}3. Use USER credentials from https://my.telegram.org/apps{Style.RESET_ALL}")
-                    print(f"{Fore.CYAN}   (NOT bot tokens from @BotFather){Style.RESET_ALL}")
-                    print(f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}\n")
+                    print(BOT_SESSION_HELP)
                 else:
-                    print(f"{Fore.YELLOW}Please restart the application and authenticate again.{Style.RESET_ALL}")
+                    print(f"{YELLOW}Please restart the application and authenticate again.{RESET}")
                 return
 
-        print(f"{Fore.YELLOW}➕ Add Single Contact{Style.RESET_ALL}")
+        print(f"{YELLOW}➕ Add Single Contact{RESET}")
         print()
 
-        phone_number = input("Enter phone number: ").strip()
+        phone_number = (await self._ainput("Enter phone number: ")).strip()
         if not phone_number:
-            print(f"{Fore.RED}❌ Phone number is required!{Style.RESET_ALL}")
+            print(f"{ERROR}Phone number is required!{RESET}")
             return
 
-        first_name = input("Enter first name (optional): ").strip()
-        last_name = input("Enter last name (optional): ").strip()
+        first_name = (await self._ainput("Enter first name (optional): ")).strip()
+        last_name = (await self._ainput("Enter last name (optional): ")).strip()
 
         try:
-            print(f"{Fore.YELLOW}Adding contact...{Style.RESET_ALL}")
+            print(f"{YELLOW}Adding contact...{RESET}")
             operation = await self.contact_manager.add_single_contact(
                 phone_str=phone_number,
                 first_name=first_name or None,
@@ -382,66 +468,39 @@ class ContactImporterCLI:
             )
 
             if operation.success:
-                print(f"{Fore.GREEN}✅ Contact added successfully!{Style.RESET_ALL}")
+                print(f"{SUCCESS}Contact added successfully!{RESET}")
                 print(f"Phone: {operation.phone.formatted}")
             else:
-                print(f"{Fore.RED}❌ Failed to add contact: {operation.error_message}{Style.RESET_ALL}")
+                print(f"{ERROR}Failed to add contact: {operation.error_message}{RESET}")
                 if "bot" in operation.error_message.lower():
-                    print(f"\n{Fore.YELLOW}⚠️  It looks like you're using a BOT session!{Style.RESET_ALL}")
-                    print(f"{Fore.YELLOW}Please run: ./reset_session.sh{Style.RESET_ALL}")
-                    print(f"{Fore.YELLOW}Then re-authenticate with USER credentials (not bot){Style.RESET_ALL}")
+                    print(f"\n{YELLOW}⚠️  It looks like you're using a BOT session!{RESET}")
+                    print(f"{YELLOW}Please run: ./reset_session.sh{RESET}")
+                    print(f"{YELLOW}Then re-authenticate with USER credentials (not bot){RESET}")
 
         except Exception as e:
             error_msg = str(e)
-            print(f"{Fore.RED}❌ Error adding contact: {error_msg}{Style.RESET_ALL}")
+            print(f"{ERROR}Error adding contact: {error_msg}{RESET}")
             if "bot" in error_msg.lower() or "disconnect" in error_msg.lower():
-                print(f"\n{Fore.YELLOW}⚠️  Session issue detected!{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}This might be because:{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}1. You're using BOT credentials instead of USER credentials{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}2. Your session was disconnected{Style.RESET_ALL}")
-                print(f"\n{Fore.CYAN}To fix:{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}  ./reset_session.sh{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}Then restart and use USER API credentials{Style.RESET_ALL}")
+                print(f"\n{YELLOW}⚠️  Session issue detected!{RESET}")
+                print(f"{YELLOW}This might be because:{RESET}")
+                print(f"{YELLOW}1. You're using BOT credentials instead of USER credentials{RESET}")
+                print(f"{YELLOW}2. Your session was disconnected{RESET}")
+                print(f"\n{CYAN}To fix:{RESET}")
+                print(f"{CYAN}  ./reset_session.sh{RESET}")
+                print(f"{CYAN}Then restart and use USER API credentials{RESET}")
 
     def export_to_vcf(self):
         """Export contacts to VCF file."""
-        print(f"{Fore.YELLOW}📇 Export to VCF File{Style.RESET_ALL}")
+        print(f"{YELLOW}📇 Export to VCF File{RESET}")
         print()
-        print(f"{Fore.CYAN}VCF files can be imported to your phone's contact list,{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}and Telegram will automatically sync them.{Style.RESET_ALL}")
+        print(f"{CYAN}VCF files can be imported to your phone's contact list,{RESET}")
+        print(f"{CYAN}and Telegram will automatically sync them.{RESET}")
         print()
 
-        # Get available files from data directory
-        data_files = self.get_data_files()
-
-        if data_files:
-            print(f"{Fore.GREEN}Available files in data directory:{Style.RESET_ALL}")
-            for i, file_path in enumerate(data_files, 1):
-                print(f"  {i}. {Path(file_path).name}")
-            print()
-
-            file_choice = input(f"Enter file number (1-{len(data_files)}) or custom path: ").strip()
-
-            # Check if user entered a number
-            try:
-                choice_num = int(file_choice)
-                if 1 <= choice_num <= len(data_files):
-                    file_path = data_files[choice_num - 1]
-                else:
-                    print(f"{Fore.YELLOW}Invalid number, using first file{Style.RESET_ALL}")
-                    file_path = data_files[0]
-            except ValueError:
-                # User entered a custom path
-                file_path = file_choice if file_choice else data_files[0]
-        else:
-            # Fallback to manual entry
-            default_file = "data/HGCS12.txt"
-            file_path = input(f"Enter file path (default: {default_file}): ").strip()
-            if not file_path:
-                file_path = default_file
+        file_path = self._choose_file()
 
         if not os.path.exists(file_path):
-            print(f"{Fore.RED}❌ File not found: {file_path}{Style.RESET_ALL}")
+            print(f"{ERROR}File not found: {file_path}{RESET}")
             return
 
         # Get output file name
@@ -456,36 +515,36 @@ class ContactImporterCLI:
             name_prefix = "Contact"
 
         try:
-            print(f"\n{Fore.YELLOW}Exporting to VCF...{Style.RESET_ALL}")
+            print(f"\n{YELLOW}Exporting to VCF...{RESET}")
 
             exporter = VCFExporter()
             result = exporter.export_from_file(file_path, output_file, name_prefix)
 
             if result['success']:
-                print(f"\n{Fore.GREEN}✅ Export successful!{Style.RESET_ALL}")
+                print(f"\n{SUCCESS}Export successful!{RESET}")
                 print(f"Total numbers: {result['total']}")
                 print(f"Valid numbers exported: {result['valid']}")
                 print(f"Invalid numbers skipped: {result['invalid']}")
                 print(f"Output file: {result['output_file']}")
-                print(f"\n{Fore.CYAN}Next steps:{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}1. Transfer {output_file} to your phone{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}2. Open the file on your phone{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}3. Import to your phone's contacts{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}4. Telegram will automatically sync them{Style.RESET_ALL}")
+                print(f"\n{CYAN}Next steps:{RESET}")
+                print(f"{CYAN}1. Transfer {output_file} to your phone{RESET}")
+                print(f"{CYAN}2. Open the file on your phone{RESET}")
+                print(f"{CYAN}3. Import to your phone's contacts{RESET}")
+                print(f"{CYAN}4. Telegram will automatically sync them{RESET}")
             else:
                 error = result.get('error', 'Unknown error')
-                print(f"\n{Fore.RED}❌ Export failed: {error}{Style.RESET_ALL}")
+                print(f"\n{ERROR}Export failed: {error}{RESET}")
 
         except Exception as e:
-            print(f"{Fore.RED}❌ Error exporting to VCF: {e}{Style.RESET_ALL}")
+            print(f"{ERROR}Error exporting to VCF: {e}{RESET}")
 
     def view_statistics(self):
         """View import statistics."""
         if not self.contact_manager:
-            print(f"{Fore.RED}❌ Please setup Telegram authentication first!{Style.RESET_ALL}")
+            print(f"{ERROR}Please setup Telegram authentication first!{RESET}")
             return
         
-        print(f"{Fore.YELLOW}📊 Import Statistics{Style.RESET_ALL}")
+        print(f"{YELLOW}📊 Import Statistics{RESET}")
         print()
         
         summary = self.contact_manager.get_operation_summary()
@@ -496,19 +555,19 @@ class ContactImporterCLI:
         print(f"Success rate: {summary['success_rate']:.1f}%")
         
         if summary['latest_operations']:
-            print(f"\n{Fore.GREEN}Recent operations:{Style.RESET_ALL}")
+            print(f"\n{GREEN}Recent operations:{RESET}")
             for i, op in enumerate(summary['latest_operations'][-5:], 1):
                 status = "✅" if op.success else "❌"
                 print(f"  {i}. {status} {op.phone.formatted} - {op.timestamp.strftime('%H:%M:%S')}")
     
     def show_configuration(self):
         """Show current configuration."""
-        print(f"{Fore.YELLOW}⚙️  Configuration{Style.RESET_ALL}")
+        print(f"{YELLOW}⚙️  Configuration{RESET}")
         print()
         
         print("Current settings:")
         print(f"Default country: {config.get('defaults.country_code', 'Not set')}")
-        print(f"Batch size: 50 (configurable per import)")
+        print(f"Batch size: {MAX_IMPORT_CONTACTS} (per Telegram request)")
         print(f"Skip existing: Yes (configurable per import)")
         
         print(f"\nSession files:")
@@ -517,99 +576,111 @@ class ContactImporterCLI:
         else:
             print(f"❌ Config: {self.config_file} (not found)")
         
-        session_files = list(Path.cwd().glob("*.session"))
-        if session_files:
-            print(f"✅ Session: {session_files[0]}")
+        session_file = self.get_session_file()
+        if session_file:
+            print(f"✅ Session: {session_file}")
         else:
             print(f"❌ Session: No session files found")
     
+    async def _ensure_connected(self) -> bool:
+        """Connect with the saved credentials the first time Telegram is needed."""
+        if self.contact_manager:
+            return True
+        if not (self.session_data.get('api_id') and self.session_data.get('api_hash')):
+            return False
+        
+        try:
+            print(f"{YELLOW}Attempting to reconnect...{RESET}")
+            self.contact_manager = await create_contact_manager(
+                self.session_data['api_id'],
+                self.session_data['api_hash']
+            )
+        except Exception as e:
+            print(f"{YELLOW}⚠️  Could not reconnect automatically: {e}{RESET}")
+            return False
+        
+        if not self.contact_manager:
+            print(f"{YELLOW}⚠️  Could not reconnect automatically{RESET}")
+            return False
+        
+        print(f"{SUCCESS}Reconnected to Telegram!{RESET}")
+        return True
+    
     async def run(self):
         """Run the interactive CLI."""
         self.print_header()
 
-        # Try to reconnect if we have session data
-        auto_import_attempted = False
+        # Connecting to Telegram is deferred until an option needs it, so
+        # previewing or exporting a file never pays for the handshake
         if self.session_data.get('api_id') and self.session_data.get('api_hash'):
-            try:
-                print(f"{Fore.YELLOW}Attempting to reconnect...{Style.RESET_ALL}")
-                self.contact_manager = await create_contact_manager(
-                    self.session_data['api_id'],
-                    self.session_data['api_hash']
-                )
-                if self.contact_manager:
-                    print(f"{Fore.GREEN}✅ Reconnected to Telegram!{Style.RESET_ALL}")
-
-                    # Check for data files and offer auto-import
-                    data_files = self.get_data_files()
-                    if data_files:
-                        print(f"\n{Fore.CYAN}Found {len(data_files)} file(s) in data directory:{Style.RESET_ALL}")
-                        for i, file_path in enumerate(data_files, 1):
-                            print(f"  {i}. {Path(file_path).name}")
-
-                        auto_import = input(f"\n{Fore.CYAN}Auto-import contacts now? (y/n): {Style.RESET_ALL}").strip().lower()
-                        if auto_import == 'y':
-                            auto_import_attempted = True
-                            # If multiple files, ask which one
-                            if len(data_files) == 1:
-                                selected_file = data_files[0]
+            data_files = self.get_data_files()
+            if data_files:
+                print(f"\n{CYAN}Found {len(data_files)} file(s) in data directory:{RESET}")
+                for i, file_path in enumerate(data_files, 1):
+                    print(f"  {i}. {Path(file_path).name}")
+
+                auto_import = (await self._ainput(f"\n{CYAN}Reconnect and auto-import contacts now? (y/n): {RESET}")).strip().lower()
+                if auto_import == 'y' and await self._ensure_connected():
+                    # If multiple files, ask which one
+                    if len(data_files) == 1:
+                        selected_file = data_files[0]
+                    else:
+                        file_choice = (await self._ainput(f"Enter file number (1-{len(data_files)}): ")).strip()
+                        try:
+                            choice_num = int(file_choice)
+                            if 1 <= choice_num <= len(data_files):
+                                selected_file = data_files[choice_num - 1]
                             else:
-                                file_choice = input(f"Enter file number (1-{len(data_files)}): ").strip()
-                                try:
-                                    choice_num = int(file_choice)
-                                    if 1 <= choice_num <= len(data_files):
-                                        selected_file = data_files[choice_num - 1]
-                                    else:
-                                        selected_file = data_files[0]
-                                except ValueError:
-                                    selected_file = data_files[0]
-
-                            # Start auto-import with the selected file
-                            await self.import_contacts_from_file(auto_file_path=selected_file)
-                            input(f"\n{Fore.CYAN}Press Enter to continue to main menu...{Style.RESET_ALL}")
-                else:
-                    print(f"{Fore.YELLOW}⚠️  Could not reconnect automatically{Style.RESET_ALL}")
-            except Exception as e:
-                print(f"{Fore.YELLOW}⚠️  Could not reconnect automatically: {e}{Style.RESET_ALL}")
+                                selected_file = data_files[0]
+                        except ValueError:
+                            selected_file = data_files[0]
+
+                    # Start auto-import with the selected file
+                    await self.import_contacts_from_file(auto_file_path=selected_file)
+                    await self._ainput(f"\n{CYAN}Press Enter to continue to main menu...{RESET}")
         
         while True:
             try:
                 self.print_menu()
-                choice = input(f"{Fore.CYAN}Enter your choice (1-8): {Style.RESET_ALL}").strip()
+                choice = (await self._ainput(f"{CYAN}Enter your choice (1-8): {RESET}")).strip()
 
                 if choice == '1':
                     await self.setup_telegram_auth()
                 elif choice == '2':
                     self.preview_phone_numbers()
                 elif choice == '3':
+                    await self._ensure_connected()
                     await self.import_contacts_from_file()
                 elif choice == '4':
                     self.export_to_vcf()
                 elif choice == '5':
+                    await self._ensure_connected()
                     await self.add_single_contact()
                 elif choice == '6':
                     self.view_statistics()
                 elif choice == '7':
                     self.show_configuration()
                 elif choice == '8':
-                    print(f"{Fore.GREEN}👋 Goodbye!{Style.RESET_ALL}")
+                    print(f"{GREEN}👋 Goodbye!{RESET}")
                     if self.contact_manager and self.contact_manager.telegram_manager:
                         await self.contact_manager.telegram_manager.disconnect()
                     break
                 else:
-                    print(f"{Fore.RED}❌ Invalid choice. Please enter 1-8.{Style.RESET_ALL}")
+                    print(f"{ERROR}Invalid choice. Please enter 1-8.{RESET}")
 
                 if choice != '8':
-                    input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+                    await self._ainput(f"\n{CYAN}Press Enter to continue...{RESET}")
                     print()
             
-            except KeyboardInterrupt:
-                print(f"\n\n{Fore.YELLOW}Interrupted by user{Style.RESET_ALL}")
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # Ctrl-C at a prompt arrives as a cancellation while awaiting _ainput
+                print(f"\n\n{YELLOW}Interrupted by user{RESET}")
                 if self.contact_manager and self.contact_manager.telegram_manager:
                     await self.contact_manager.telegram_manager.disconnect()
                 break
             except Exception as e:
-                print(f"\n{Fore.RED}❌ Unexpected error: {e}{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+                print(f"\n{ERROR}Unexpected error: {e}{RESET}")
+                await self._ainput(f"{CYAN}Press Enter to continue...{RESET}")
 
 
 def main():
@@ -618,9 +689,9 @@ def main():
         cli = ContactImporterCLI()
         asyncio.run(cli.run())
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Goodbye!{Style.RESET_ALL}")
+        print(f"\n{YELLOW}Goodbye!{RESET}")
     except Exception as e:
-        print(f"{Fore.RED}Fatal error: {e}{Style.RESET_ALL}")
+        print(f"{RED}Fatal error: {e}{RESET}")
         sys.exit(1)
 
 
@@ -1,11 +1,61 @@
 """Configuration management for Contact Importer."""
 
-import os
+import copy
+import functools
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# config.yaml in the project root
+DEFAULT_CONFIG_PATH = str(Path(__file__).parent.parent / "config.yaml")
+
+# Used when config.yaml is missing or unparsable; each Config gets its own copy
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "defaults": {
+        "output_format": "vcf",
+        "country_code": "KE",
+        "output_filename": "imported_contacts",
+        "duplicate_handling": "skip"
+    },
+    "phone_formatting": {
+        "remove_chars": ["-", "(", ")", " ", "."],
+        "international_format": True,
+        "auto_add_country_code": True
+    },
+    "validation": {
+        "strict_mode": False,
+        "min_length": 7,
+        "max_length": 15
+    },
+    "logging": {
+        "level": "INFO",
+        "log_file": "contact_importer.log",
+        "console_output": True
+    }
+}
+
+# Sentinel for Config.get cache misses (None is a valid config value)
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML config file once per process.
+    
+    The returned dict is shared between every Config built from the same
+    path, so treat it as read-only.
+    """
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=YamlLoader) or {}
+
 
 class Config:
     """Configuration manager for the Contact Importer."""
@@ -13,19 +63,19 @@ class Config:
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
         self.config = self._load_config()
+        # Resolved dotted-key lookups; must be cleared if self.config is replaced
+        self._get_cache: Dict[str, Any] = {}
+        # Dotted keys split into interned parts; kept for keys that miss too
+        self._split_cache: Dict[str, Tuple[str, ...]] = {}
     
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
-        # Look for config.yaml in the project root
-        current_dir = Path(__file__).parent.parent
-        config_file = current_dir / "config.yaml"
-        return str(config_file)
+        return DEFAULT_CONFIG_PATH
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            return _parse_config_file(self.config_path)
         except FileNotFoundError:
             print(f"Warning: Config file not found at {self.config_path}")
             return self._get_default_config()
@@ -35,41 +85,29 @@ class Config:
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration if file is not found."""
-        return {
-            "defaults": {
-                "output_format": "vcf",
-                "country_code": "KE",
-                "output_filename": "imported_contacts",
-                "duplicate_handling": "skip"
-            },
-            "phone_formatting": {
-                "remove_chars": ["-", "(", ")", " ", "."],
-                "international_format": True,
-                "auto_add_country_code": True
-            },
-            "validation": {
-                "strict_mode": False,
-                "min_length": 7,
-                "max_length": 15
-            },
-            "logging": {
-                "level": "INFO",
-                "log_file": "contact_importer.log",
-                "console_output": True
-            }
-        }
+        # A copy, so a caller mutating e.g. get_phone_formatting() can't
+        # change the defaults for the rest of the process
+        return copy.deepcopy(DEFAULT_CONFIG)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        keys = key.split('.')
+        value = self._get_cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        keys = self._split_cache.get(key)
+        if keys is None:
+            keys = self._split_cache[key] = tuple(sys.intern(k) for k in key.split('.'))
         value = self.config
         
         for k in keys:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
+                # Not cached: the caller's default may differ between calls
                 return default
         
+        self._get_cache[key] = value
         return value
     
     def get_defaults(self) -> Dict[str, Any]:
@@ -94,5 +132,18 @@ class Config:
         return country_codes.get(country.upper(), '')
 
 
-# Global config instance
-config = Config()
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the global Config, loading it on first use."""
+    return Config()
+
+
+class _LazyConfig:
+    """Stand-in for the global Config that only loads it when first used."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+
+# Global config instance (loaded lazily, so importing this module is cheap)
+config = _LazyConfig()
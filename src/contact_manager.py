@@ -2,25 +2,29 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
-from .phone_parser import PhoneNumber, parse_phone_file
-from .telegram_client import TelegramContactManager
+from .phone_parser import DATACLASS_SLOTS, PhoneNumber, PhoneParser, parse_phone_file
+from .telegram_client import MAX_IMPORT_CONTACTS, TelegramContactManager
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ContactOperation:
     """Represents a contact operation result."""
     phone: PhoneNumber
     success: bool
     error_message: Optional[str] = None
-    timestamp: Optional[datetime] = None
+    # time.time() when the operation was recorded; a float is far cheaper to
+    # take than datetime.now() for every contact in a bulk import
+    created: float = field(default_factory=time.time)
     
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    @property
+    def timestamp(self) -> datetime:
+        """Local time the operation was recorded."""
+        return datetime.fromtimestamp(self.created)
 
 
 class ContactManager:
@@ -31,18 +35,47 @@ class ContactManager:
         self.telegram_manager = telegram_manager
         self.logger = logging.getLogger(__name__)
         self.operations_log: List[ContactOperation] = []
+        # Successful operations in operations_log, counted as _log_operations
+        # adds them; _counted_log/_counted_len detect outside changes to the log
+        self._successful_count = 0
+        self._counted_log = self.operations_log
+        self._counted_len = 0
+        # Reused by add_single_contact rather than rebuilt per contact
+        self._parser = PhoneParser()
     
     async def import_from_file(self, file_path: str, 
                              skip_existing: bool = True,
-                             batch_size: int = 50,
-                             name_prefix: str = "Contact") -> Dict[str, Any]:
-        """Import contacts from a file."""
+                             batch_size: int = MAX_IMPORT_CONTACTS,
+                             name_prefix: str = "Contact",
+                             progress_callback: Optional[Callable[[int, int], None]] = None,
+                             concurrency: Optional[int] = None,
+                             existing_contacts: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Import contacts from a file.
         
-        # Parse phone numbers from file
+        Up to `concurrency` batches (default: import.concurrency from the
+        config) are sent to Telegram at once. If given, `progress_callback`
+        is called after each batch with its successful and failed counts
+        (e.g. ProgressTracker.update_many). With `skip_existing`, numbers
+        already in `existing_contacts` are skipped; if not given, the
+        contact list is fetched from Telegram.
+        """
+        
+        # The existing-contacts fetch is network-bound, so start it now and
+        # let it run while the file is parsed
+        existing_task = None
+        if skip_existing and existing_contacts is None:
+            self.logger.info("Checking for existing contacts...")
+            existing_task = asyncio.ensure_future(self.telegram_manager.get_existing_contacts())
+        
+        # Parse phone numbers from file. Parsing is CPU-bound, so it runs on a
+        # worker thread rather than blocking the event loop.
         self.logger.info(f"Parsing phone numbers from {file_path}")
+        loop = asyncio.get_running_loop()
         try:
-            phone_numbers, stats = parse_phone_file(file_path)
+            phone_numbers, stats = await loop.run_in_executor(None, parse_phone_file, file_path)
         except Exception as e:
+            if existing_task:
+                existing_task.cancel()
             self.logger.error(f"Failed to parse file: {e}")
             return {
                 'success': False,
@@ -52,10 +85,12 @@ class ContactManager:
         
         self.logger.info(f"Parsed {stats['total']} numbers, {stats['valid']} valid")
         
-        # Filter valid numbers
-        valid_numbers = [p for p in phone_numbers if p.is_valid]
+        # Filter valid numbers; the stats already say whether there is anything to drop
+        valid_numbers = [p for p in phone_numbers if p.is_valid] if stats['invalid'] else phone_numbers
         
         if not valid_numbers:
+            if existing_task:
+                existing_task.cancel()
             return {
                 'success': False,
                 'error': 'No valid phone numbers found',
@@ -63,70 +98,71 @@ class ContactManager:
             }
         
         # Check for existing contacts if requested
+        skipped = 0
         if skip_existing:
-            self.logger.info("Checking for existing contacts...")
-            existing = await self.telegram_manager.get_existing_contacts()
-            valid_numbers = [p for p in valid_numbers if p.formatted not in existing]
+            if existing_task:
+                existing_contacts = await existing_task
+            # Set membership keeps this O(V + E) whatever the caller passed
+            existing = existing_contacts if isinstance(existing_contacts, (set, frozenset)) else set(existing_contacts)
+            new_numbers = [p for p in valid_numbers if p.formatted not in existing]
+            skipped = len(valid_numbers) - len(new_numbers)
+            valid_numbers = new_numbers
             self.logger.info(f"Filtered to {len(valid_numbers)} new contacts")
         
         if not valid_numbers:
             return {
                 'success': True,
                 'message': 'All contacts already exist',
-                'stats': stats,
+                'stats': {**stats, 'skipped': skipped},
                 'operations': []
             }
         
         # Import contacts in batches
         self.logger.info(f"Importing {len(valid_numbers)} contacts in batches of {batch_size}")
         
-        total_successful = 0
-        total_failed = 0
-        all_errors = []
+        total_batches = -(-len(valid_numbers) // batch_size)
+        # Operations per batch, in file order whichever batch finishes first
+        batch_operations: List[List[ContactOperation]] = [[] for _ in range(total_batches)]
         
-        for i in range(0, len(valid_numbers), batch_size):
-            batch = valid_numbers[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(valid_numbers) + batch_size - 1) // batch_size
+        def record_batch(index: int, batch: List[PhoneNumber], batch_result: Dict[str, Any]):
+            self.logger.info(f"Batch {index + 1}/{total_batches} done ({len(batch)} contacts)")
             
-            self.logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} contacts)")
+            # Log individual operations
+            imported = frozenset(batch_result['imported_phones'])
+            # A batch that failed outright carries the reason instead of a generic message
+            error_message = batch_result['errors'][0] if not imported and batch_result['errors'] else "Import failed"
+            operations = batch_operations[index] = [
+                ContactOperation(
+                    phone=phone,
+                    success=phone.formatted in imported,
+                    error_message=None if phone.formatted in imported else error_message
+                )
+                for phone in batch
+            ]
             
-            try:
-                batch_result = await self._process_batch(batch, name_prefix)
-                total_successful += batch_result['successful']
-                total_failed += batch_result['failed']
-                all_errors.extend(batch_result['errors'])
-                
-                # Log individual operations
-                # ImportedContact objects have user_id, not phone, so we check by count
-                imported_count = batch_result['successful']
-                for idx, phone in enumerate(batch):
-                    # Assume first N contacts in batch were successful if imported_count > 0
-                    success = idx < imported_count
-                    operation = ContactOperation(
-                        phone=phone,
-                        success=success,
-                        error_message=None if success else "Import failed"
-                    )
-                    self.operations_log.append(operation)
-                
-                # Small delay between batches
-                if i + batch_size < len(valid_numbers):
-                    await asyncio.sleep(2)
-                    
-            except Exception as e:
-                self.logger.error(f"Batch {batch_num} failed: {e}")
-                total_failed += len(batch)
-                all_errors.append(f"Batch {batch_num}: {str(e)}")
-                
-                # Log failed operations
-                for phone in batch:
-                    operation = ContactOperation(
-                        phone=phone,
-                        success=False,
-                        error_message=str(e)
-                    )
-                    self.operations_log.append(operation)
+            if progress_callback:
+                successful = sum(1 for op in operations if op.success)
+                progress_callback(successful, len(operations) - successful)
+        
+        try:
+            result = await self.telegram_manager.add_contacts_bulk(
+                valid_numbers,
+                batch_size=batch_size,
+                name_prefix=name_prefix,
+                max_concurrent_batches=concurrency,
+                on_batch=record_batch
+            )
+        except Exception as e:
+            self.logger.error(f"Import failed: {e}")
+            operations = [ContactOperation(phone=phone, success=False, error_message=str(e)) for phone in valid_numbers]
+            batch_operations = [operations]
+            result = {'successful': 0, 'failed': len(valid_numbers), 'errors': [str(e)]}
+        finally:
+            # Logged even if the import is interrupted part-way
+            import_operations = [op for operations in batch_operations for op in operations]
+            self._log_operations(import_operations)
+        
+        total_successful = result['successful']
         
         return {
             'success': total_successful > 0,
@@ -134,27 +170,20 @@ class ContactManager:
                 **stats,
                 'attempted': len(valid_numbers),
                 'successful': total_successful,
-                'failed': total_failed,
+                'failed': result['failed'],
+                'skipped': skipped,
                 'success_rate': (total_successful / len(valid_numbers) * 100) if valid_numbers else 0
             },
-            'errors': all_errors,
-            'operations': self.operations_log[-len(valid_numbers):]  # Recent operations
+            'errors': result['errors'],
+            'operations': import_operations
         }
     
-    async def _process_batch(self, batch: List[PhoneNumber], name_prefix: str) -> Dict[str, Any]:
-        """Process a batch of contacts."""
-        # Use the bulk import method with the name prefix
-        result = await self.telegram_manager.add_contacts_bulk(batch, name_prefix=name_prefix)
-        return result
-    
     async def add_single_contact(self, phone_str: str, 
                                first_name: Optional[str] = None, 
                                last_name: str = "") -> ContactOperation:
         """Add a single contact."""
         # Parse the phone number
-        from .phone_parser import PhoneParser
-        parser = PhoneParser()
-        phone = parser.parse_number(phone_str)
+        phone = self._parser.parse_number(phone_str)
         
         if not phone.is_valid:
             operation = ContactOperation(
@@ -162,7 +191,7 @@ class ContactManager:
                 success=False,
                 error_message=phone.error_message or "Invalid phone number"
             )
-            self.operations_log.append(operation)
+            self._log_operations([operation])
             return operation
         
         try:
@@ -172,7 +201,7 @@ class ContactManager:
                 success=success,
                 error_message=None if success else "Failed to add contact"
             )
-            self.operations_log.append(operation)
+            self._log_operations([operation])
             return operation
             
         except Exception as e:
@@ -181,9 +210,23 @@ class ContactManager:
                 success=False,
                 error_message=str(e)
             )
-            self.operations_log.append(operation)
+            self._log_operations([operation])
             return operation
     
+    def _log_operations(self, operations: List[ContactOperation]):
+        """Append to operations_log, keeping the success count current."""
+        self._sync_success_count()
+        self.operations_log.extend(operations)
+        self._successful_count += sum(1 for op in operations if op.success)
+        self._counted_len = len(self.operations_log)
+    
+    def _sync_success_count(self):
+        """Recount if operations_log was replaced or changed outside _log_operations."""
+        if self.operations_log is not self._counted_log or len(self.operations_log) != self._counted_len:
+            self._counted_log = self.operations_log
+            self._counted_len = len(self.operations_log)
+            self._successful_count = sum(1 for op in self.operations_log if op.success)
+    
     def get_operation_summary(self) -> Dict[str, Any]:
         """Get summary of all operations performed."""
         if not self.operations_log:
@@ -194,8 +237,9 @@ class ContactManager:
                 'success_rate': 0
             }
         
+        self._sync_success_count()
         total = len(self.operations_log)
-        successful = sum(1 for op in self.operations_log if op.success)
+        successful = self._successful_count
         failed = total - successful
         
         return {
@@ -207,21 +251,27 @@ class ContactManager:
         }
     
     def save_operations_log(self, file_path: str):
-        """Save operations log to a file."""
-        import json
+        """Save operations log to a file.
         
-        log_data = []
-        for op in self.operations_log:
-            log_data.append({
-                'phone_raw': op.phone.raw,
-                'phone_formatted': op.phone.formatted,
-                'success': op.success,
-                'error_message': op.error_message,
-                'timestamp': op.timestamp.isoformat() if op.timestamp else datetime.now().isoformat()
-            })
+        Written as a JSON array with one compact record per line, streamed
+        so the whole log is never duplicated in memory.
+        """
+        import json
         
         with open(file_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
+            f.write('[')
+            separator = '\n'
+            for op in self.operations_log:
+                f.write(separator)
+                f.write(json.dumps({
+                    'phone_raw': op.phone.raw,
+                    'phone_formatted': op.phone.formatted,
+                    'success': op.success,
+                    'error_message': op.error_message,
+                    'timestamp': op.timestamp.isoformat()
+                }, separators=(',', ':')))
+                separator = ',\n'
+            f.write('\n]\n')
         
         self.logger.info(f"Operations log saved to {file_path}")
 
@@ -230,7 +280,7 @@ async def create_contact_manager(api_id: str, api_hash: str, phone_number: Optio
     """Create and authenticate a contact manager."""
     
     # Try to load existing session first
-    telegram_manager = TelegramContactManager.load_session_info()
+    telegram_manager = await TelegramContactManager.load_session_info()
     
     if not telegram_manager:
         if not api_id or not api_hash:
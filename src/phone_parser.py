@@ -1,15 +1,85 @@
 """Phone number parser and validator for contact importer."""
 
+import functools
 import re
+import sys
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 import phonenumbers
 
 from .config import config
 
+# Compiled once so per-line extraction doesn't go through re's pattern cache
+PHONE_PATTERN = re.compile(r'[\d\-\(\)\.\s\+]{7,}')
 
-@dataclass
+# Deletes the ASCII subset of PHONE_PATTERN's characters; an empty result means
+# the whole string would match
+PHONE_CHARS_DELETE = str.maketrans('', '', '0123456789-().+ ')
+
+# Read buffer for streamed phone files; 64KiB means far fewer read() calls
+# than the 8KiB default on multi-megabyte lists
+READ_BUFFER_SIZE = 64 * 1024
+
+# Leading digits (other than 1) that mark an 11+ digit number as international
+INTERNATIONAL_FIRST_DIGITS = frozenset('23456789')
+
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_cleaned(cleaned: str, default_country: str) -> Tuple[str, str, bool, Optional[str]]:
+    """Run a cleaned number through phonenumbers.
+    
+    Returns (formatted, country_code, is_valid, error_message). Cached on
+    the cleaned string, so duplicates that differ only in separators or
+    surrounding text share one parse.
+    """
+    # Set when the +-prefixed attempt below already produced a valid number
+    parsed = None
+    
+    # If the number doesn't start with +, try adding it if it looks like an international number
+    # (numbers starting with digits that could be country codes)
+    if not cleaned.startswith('+') and len(cleaned) >= 10:
+        # Try with + prefix first (for international format without +)
+        try:
+            test_parsed = phonenumbers.parse('+' + cleaned, None)
+            if phonenumbers.is_valid_number(test_parsed):
+                # Already parsed and validated; the region is ignored once
+                # there is a +, so parsing again would give the same result
+                cleaned = '+' + cleaned
+                parsed = test_parsed
+        except:
+            # If that fails, continue with original cleaned number
+            pass
+
+    try:
+        # Parse with phonenumbers library
+        if parsed is None:
+            parsed = phonenumbers.parse(cleaned, default_country)
+            is_valid = phonenumbers.is_valid_number(parsed)
+        else:
+            is_valid = True
+        
+        # Validate the number
+        if is_valid:
+            # Format the number. E.164 is just +<country code><national number>
+            # unless leading zeros have to be kept, so only then is the
+            # library's formatter needed.
+            if parsed.italian_leading_zero:
+                formatted = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+            else:
+                formatted = f"+{parsed.country_code}{parsed.national_number}"
+            return formatted, f"+{parsed.country_code}", True, None
+        return cleaned, "", False, "Invalid phone number format"
+            
+    except phonenumbers.NumberParseException as e:
+        return cleaned, "", False, str(e)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PhoneNumber:
     """Represents a parsed phone number."""
     raw: str
@@ -27,33 +97,46 @@ class PhoneParser:
         self.default_country = default_country
         self.validation_config = config.get_validation()
         self.formatting_config = config.get_phone_formatting()
+        # Single characters are deleted in one translate() pass; any longer
+        # entries in remove_chars still go through str.replace
+        remove_chars = self.formatting_config.get('remove_chars', [])
+        self._delete_table = str.maketrans('', '', ''.join(c for c in remove_chars if len(c) == 1))
+        self._remove_strings = [c for c in remove_chars if len(c) > 1]
+        # Settings read per number, resolved once
+        self._min_length = self.validation_config.get('min_length', 7)
+        self._auto_add_country_code = self.formatting_config.get('auto_add_country_code', False)
+        self._country_code = config.get_country_code(default_country)
+    
+    def parse_file(self, file_path: str, limit: Optional[int] = None) -> List[PhoneNumber]:
+        """Parse phone numbers from a text file, stopping after `limit` numbers if given."""
+        return list(islice(self.iter_file(file_path), limit))
     
-    def parse_file(self, file_path: str) -> List[PhoneNumber]:
-        """Parse phone numbers from a text file."""
+    def iter_file(self, file_path: str) -> Iterator[PhoneNumber]:
+        """Yield phone numbers from a text file as they are parsed."""
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        phone_numbers = []
-        with open(path, 'r', encoding='utf-8') as f:
+        with open(path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
             for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#') or line.startswith('//'):
-                    continue
-                
-                # Skip lines that look like headers or labels
-                if any(char.isalpha() for char in line) and not self._looks_like_phone(line):
-                    continue
-                
-                # Try to extract phone number from line
-                phone = self._extract_phone_from_line(line)
+                phone = self._candidate_from_line(line)
                 if phone:
-                    parsed = self.parse_number(phone, line_num)
-                    phone_numbers.append(parsed)
+                    yield self.parse_number(phone, line_num)
+    
+    def _candidate_from_line(self, line: str) -> Optional[str]:
+        """Return the phone number candidate on a line, or None if it should be skipped."""
+        line = line.strip()
         
-        return phone_numbers
+        # Skip empty lines, comments, and lines too short for PHONE_PATTERN to match
+        if len(line) < 7 or line.startswith(('#', '//')):
+            return None
+        
+        # Skip lines that look like headers or labels
+        if any(map(str.isalpha, line)) and not self._looks_like_phone(line):
+            return None
+        
+        # Try to extract phone number from line
+        return self._extract_phone_from_line(line)
     
     def parse_number(self, phone_str: str, line_num: Optional[int] = None) -> PhoneNumber:
         """Parse a single phone number string."""
@@ -62,68 +145,28 @@ class PhoneParser:
         # Clean the phone number
         cleaned = self._clean_phone_number(original)
 
-        # If the number doesn't start with +, try adding it if it looks like an international number
-        # (numbers starting with digits that could be country codes)
-        if not cleaned.startswith('+') and len(cleaned) >= 10:
-            # Try with + prefix first (for international format without +)
-            try:
-                test_parsed = phonenumbers.parse('+' + cleaned, None)
-                if phonenumbers.is_valid_number(test_parsed):
-                    cleaned = '+' + cleaned
-            except:
-                # If that fails, continue with original cleaned number
-                pass
-
-        try:
-            # Parse with phonenumbers library
-            parsed = phonenumbers.parse(cleaned, self.default_country)
-            
-            # Validate the number
-            is_valid = phonenumbers.is_valid_number(parsed)
-            
-            if is_valid:
-                # Format the number
-                formatted = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-                country_code = f"+{parsed.country_code}"
-                
-                return PhoneNumber(
-                    raw=original,
-                    formatted=formatted,
-                    country_code=country_code,
-                    is_valid=True
-                )
-            else:
-                return PhoneNumber(
-                    raw=original,
-                    formatted=cleaned,
-                    country_code="",
-                    is_valid=False,
-                    error_message="Invalid phone number format"
-                )
-                
-        except phonenumbers.NumberParseException as e:
-            return PhoneNumber(
-                raw=original,
-                formatted=cleaned,
-                country_code="",
-                is_valid=False,
-                error_message=str(e)
-            )
+        formatted, country_code, is_valid, error_message = _parse_cleaned(cleaned, self.default_country)
+        return PhoneNumber(
+            raw=original,
+            formatted=formatted,
+            country_code=country_code,
+            is_valid=is_valid,
+            error_message=error_message
+        )
     
     def _clean_phone_number(self, phone: str) -> str:
         """Clean phone number by removing unwanted characters."""
         # Remove characters specified in config
-        chars_to_remove = self.formatting_config.get('remove_chars', [])
-        for char in chars_to_remove:
-            phone = phone.replace(char, '')
-
-        # Auto-detect international numbers without + prefix
-        # Check if it starts with a likely country code and add + if missing
-        if not phone.startswith('+') and len(phone) >= 10:
-            # Common country code patterns
-            # Try to detect if this is an international number
-            if (phone.startswith('1') and len(phone) == 11) or \
-               (phone.startswith(('2', '3', '4', '5', '6', '7', '8', '9')) and len(phone) >= 11):
+        phone = phone.translate(self._delete_table)
+        for chars in self._remove_strings:
+            phone = phone.replace(chars, '')
+
+        # Auto-detect international numbers without + prefix: 11 digits
+        # starting with 1, or 11+ digits starting with a likely country code
+        length = len(phone)
+        if length >= 11:
+            first = phone[0]
+            if first in INTERNATIONAL_FIRST_DIGITS or (first == '1' and length == 11):
                 # Looks like international format without +
                 phone = '+' + phone
 
@@ -135,19 +178,20 @@ class PhoneParser:
                 phone = '+852 ' + phone[5:]  # Remove 82102 prefix and add +852
 
         # If no country code and auto_add_country_code is enabled
-        elif self.formatting_config.get('auto_add_country_code', False):
-            if not phone.startswith('+'):
-                country_code = config.get_country_code(self.default_country)
-                if country_code:
-                    phone = country_code + phone
+        elif self._auto_add_country_code:
+            if not phone.startswith('+') and self._country_code:
+                phone = self._country_code + phone
 
         return phone
     
     def _extract_phone_from_line(self, line: str) -> Optional[str]:
         """Extract phone number from a line of text."""
+        # A line made only of phone characters is one whole match; skip the regex
+        if len(line) >= 7 and not line.translate(PHONE_CHARS_DELETE):
+            return line.strip()
+        
         # Look for sequences of digits with optional separators
-        phone_pattern = r'[\d\-\(\)\.\s\+]{7,}'
-        matches = re.findall(phone_pattern, line)
+        matches = PHONE_PATTERN.findall(line)
         
         if matches:
             # Return the longest match (most likely to be a complete phone number)
@@ -157,21 +201,28 @@ class PhoneParser:
     
     def _looks_like_phone(self, text: str) -> bool:
         """Check if text looks like it could contain a phone number."""
-        # Count digits in the text
-        digit_count = sum(1 for char in text if char.isdigit())
-        return digit_count >= self.validation_config.get('min_length', 7)
+        # Count digits in the text (map() keeps the per-character loop in C)
+        digit_count = sum(map(str.isdigit, text))
+        return digit_count >= self._min_length
     
-    def get_stats(self, phone_numbers: List[PhoneNumber]) -> dict:
-        """Get statistics about parsed phone numbers."""
-        total = len(phone_numbers)
-        valid = sum(1 for p in phone_numbers if p.is_valid)
-        invalid = total - valid
+    def get_stats(self, phone_numbers: Iterable[PhoneNumber]) -> dict:
+        """Get statistics about parsed phone numbers.
+        
+        Works in a single pass, so `phone_numbers` may be a generator such
+        as iter_file().
+        """
+        total = valid = 0
         
         # Count by country code
         country_codes = {}
         for phone in phone_numbers:
-            if phone.is_valid and phone.country_code:
-                country_codes[phone.country_code] = country_codes.get(phone.country_code, 0) + 1
+            total += 1
+            if phone.is_valid:
+                valid += 1
+                if phone.country_code:
+                    country_codes[phone.country_code] = country_codes.get(phone.country_code, 0) + 1
+        
+        invalid = total - valid
         
         return {
             'total': total,
@@ -182,9 +233,68 @@ class PhoneParser:
         }
 
 
-def parse_phone_file(file_path: str, country: str = "HK") -> Tuple[List[PhoneNumber], dict]:
+def _sampling(phone_numbers: Iterable[PhoneNumber], valid_sample: List[PhoneNumber],
+              invalid_sample: List[PhoneNumber], valid_limit: int,
+              invalid_limit: int) -> Iterator[PhoneNumber]:
+    """Yield phone_numbers unchanged, filling the samples with the first few valid/invalid ones."""
+    for phone in phone_numbers:
+        if phone.is_valid:
+            if len(valid_sample) < valid_limit:
+                valid_sample.append(phone)
+        elif len(invalid_sample) < invalid_limit:
+            invalid_sample.append(phone)
+        yield phone
+
+
+def sample_numbers(phone_numbers: List[PhoneNumber], valid_limit: int = 5,
+                   invalid_limit: int = 3) -> Tuple[List[PhoneNumber], List[PhoneNumber]]:
+    """Return the first few valid and invalid numbers in a single pass.
+    
+    Stops as soon as both samples are full, so the full valid/invalid
+    lists are never built. Totals are available from get_stats().
+    """
+    valid_sample, invalid_sample = [], []
+    for _ in _sampling(phone_numbers, valid_sample, invalid_sample, valid_limit, invalid_limit):
+        if len(valid_sample) == valid_limit and len(invalid_sample) == invalid_limit:
+            break
+    return valid_sample, invalid_sample
+
+
+def preview_phone_file(file_path: str, country: str = "HK", valid_limit: int = 5,
+                       invalid_limit: int = 3) -> Tuple[List[PhoneNumber], List[PhoneNumber], dict]:
+    """Stream a phone file, returning valid/invalid samples and full stats.
+    
+    Unlike parse_phone_file, the parsed numbers are never held in a list, so
+    memory stays flat however large the file is.
+    """
+    parser = PhoneParser(country)
+    valid_sample, invalid_sample = [], []
+    stats = parser.get_stats(_sampling(
+        parser.iter_file(file_path), valid_sample, invalid_sample, valid_limit, invalid_limit
+    ))
+    return valid_sample, invalid_sample, stats
+
+
+def count_lines(file_path: str) -> int:
+    """Count the lines in a file without decoding or parsing them.
+    
+    An upper bound on the numbers parse_phone_file() can return; cheap
+    enough to size a progress bar before an import.
+    """
+    lines = 0
+    last = b"\n"
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return lines + (last != b"\n")
+
+
+def parse_phone_file(file_path: str, country: str = "HK",
+                     limit: Optional[int] = None) -> Tuple[List[PhoneNumber], dict]:
     """Convenience function to parse a phone file and return numbers with stats."""
     parser = PhoneParser(country)
-    numbers = parser.parse_file(file_path)
+    numbers = parser.parse_file(file_path, limit=limit)
     stats = parser.get_stats(numbers)
-    return numbers, stats
\ No newline at end of file
+    return numbers, stats
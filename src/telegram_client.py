@@ -1,41 +1,188 @@
 """Telegram client wrapper for adding contacts."""
 
 import asyncio
+import importlib.util
 import json
 import logging
+import random
+import time
+from collections import deque
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, FrozenSet, List, Optional, Tuple
 
 # Import telethon with error handling
 TELETHON_AVAILABLE = False
 try:
     from telethon import TelegramClient, errors
-    from telethon.tl.functions.contacts import AddContactRequest, ImportContactsRequest
+    from telethon.sessions import SQLiteSession
+    from telethon.tl.functions.contacts import GetContactsRequest, ImportContactsRequest
     from telethon.tl.types import InputPhoneContact
     TELETHON_AVAILABLE = True
 except ImportError:
     # Create dummy classes for type checking
     class TelegramClient:
         pass
+    class SQLiteSession:
+        pass
     class errors:
         class FloodWaitError(Exception):
             def __init__(self, seconds):
                 self.seconds = seconds
-    class AddContactRequest:
+        class ServerError(Exception):
+            pass
+    class GetContactsRequest:
         pass
     class ImportContactsRequest:
         pass
     class InputPhoneContact:
         pass
 
+# cryptg gives Telethon native (AES-NI) AES-IGE; without it encryption is far slower.
+# Only its presence matters here (Telethon imports it itself).
+CRYPTG_AVAILABLE = importlib.util.find_spec("cryptg") is not None
+
+# orjson is optional; both variants read and write indented UTF-8 JSON bytes
+try:
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as json_loads
+    
+    def json_dumps_indented(obj) -> bytes:
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as json_loads
+    
+    def json_dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
 from .config import config
 from .phone_parser import PhoneNumber
+from .utils import run_blocking
+
+# Telethon names the session database "<session_name>.session" in the working directory
+DEFAULT_SESSION_NAME = "contact_importer"
+
+
+class MmapSQLiteSession(SQLiteSession):
+    """Telethon SQLite session that memory-maps the database and uses WAL.
+    
+    Reading the auth key on connect becomes page faults on a mapping rather
+    than many small reads, and WAL avoids rewriting the main file on commit.
+    """
+    
+    MMAP_SIZE = 256 * 1024 * 1024
+    
+    def _cursor(self):
+        new_connection = self._conn is None
+        cursor = super()._cursor()
+        if new_connection:
+            cursor.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+            cursor.execute("PRAGMA journal_mode=WAL")
+        return cursor
+
+
+# Contacts sent per ImportContactsRequest; larger lists are split into chunks this size
+MAX_IMPORT_CONTACTS = 1000
+
+# Connected clients shared by every manager for the same (api_id, session_name).
+# A second manager or a repeated connect() reuses the open connection and auth
+# key instead of a new handshake.
+_CLIENT_POOL: Dict[Tuple[str, str], Any] = {}
+# Number of managers holding each client. Counted per client rather than per
+# pool key, so a client replaced in the pool after dropping is still closed
+# once the last manager holding it lets go.
+_CLIENT_REFS: Dict[Any, int] = {}
+_client_pool_lock: Optional[asyncio.Lock] = None
+
+
+def _get_client_pool_lock() -> asyncio.Lock:
+    """Return the pool lock, created on first use inside the running loop."""
+    global _client_pool_lock
+    if _client_pool_lock is None:
+        _client_pool_lock = asyncio.Lock()
+    return _client_pool_lock
+
+
+def _release_client(key: Tuple[str, str], client) -> bool:
+    """Drop one manager's hold on client (pool lock held).
+    
+    Returns True if that was the last hold, i.e. the caller should close it.
+    """
+    refs = _CLIENT_REFS.get(client, 0) - 1
+    if refs > 0:
+        _CLIENT_REFS[client] = refs
+        return False
+    _CLIENT_REFS.pop(client, None)
+    if _CLIENT_POOL.get(key) is client:
+        del _CLIENT_POOL[key]
+    return True
+
+
+class TokenBucket:
+    """Monotonic-clock token bucket that paces requests on the client side.
+    
+    After a server-side rate limit, slow_down() halves the rate for a while;
+    it then climbs back by one request/s per second (AIMD).
+    """
+    
+    def __init__(self, rate: float, capacity: float, min_rate: float = 0.5):
+        self.max_rate = self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        # No rate increase before this time
+        self.hold_until = 0.0
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.rate < self.max_rate and now >= self.hold_until:
+            self.rate = min(self.max_rate, self.rate + 1)
+            self.hold_until = now + 1
+    
+    def try_consume(self, tokens: float = 1) -> bool:
+        """Take `tokens` if available."""
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+    
+    def time_until_next(self, tokens: float = 1) -> float:
+        """Seconds until `tokens` will be available at the current rate."""
+        return max(0.0, (tokens - self.tokens) / self.rate)
+    
+    def slow_down(self, hold: float = 60):
+        """Halve the rate and keep it there for `hold` seconds."""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.hold_until = time.monotonic() + hold
 
 
 class TelegramContactManager:
     """Manages Telegram contact operations."""
     
-    def __init__(self, api_id: str, api_hash: str, session_name: str = "contact_importer"):
+    # Seconds a fetched contact list is reused by get_existing_contacts
+    CONTACTS_CACHE_TTL = 60
+    
+    # Retry policy for single RPCs (see _with_retry)
+    RPC_MAX_TRIES = 5
+    RPC_BACKOFF_BASE = 0.5
+    RPC_BACKOFF_CAP = 30
+    RPC_MAX_FLOOD_WAIT = 120
+    
+    # Client-side request pacing (requests/s and burst size); overridden by
+    # import.rate_limit_rps / import.rate_limit_burst in the config
+    RPC_RATE = 25
+    RPC_BURST = 25
+    
+    # Seconds a flood wait counts towards pacing_delay()
+    FLOOD_WINDOW = 30
+    
+    def __init__(self, api_id: str, api_hash: str, session_name: str = DEFAULT_SESSION_NAME):
         """Initialize Telegram client."""
         if not TELETHON_AVAILABLE:
             raise ImportError("Telethon not installed. Please run: pip install telethon")
@@ -44,6 +191,21 @@ class TelegramContactManager:
         self.api_hash = api_hash
         self.session_name = session_name
         self.client = None
+        # Account the session is logged in as, cached from connect()/login
+        self.me = None
+        # Existing contact numbers and the time.monotonic() they were fetched at;
+        # numbers we import are added to the set
+        self._contacts_set: Optional[FrozenSet[str]] = None
+        self._contacts_ts = 0.0
+        # Serializes connect()/login_with_phone(); see _get_connect_lock
+        self._connect_lock: Optional[asyncio.Lock] = None
+        # Paces the RPCs sent through _with_retry
+        self._rate_limiter = TokenBucket(
+            config.get('import.rate_limit_rps', self.RPC_RATE),
+            config.get('import.rate_limit_burst', self.RPC_BURST)
+        )
+        # time.monotonic() of recent flood waits, for pacing_delay()
+        self._flood_times: Deque[float] = deque()
         self.logger = logging.getLogger(__name__)
         
         # Session file path
@@ -58,13 +220,56 @@ class TelegramContactManager:
         """Async context manager exit."""
         await self.disconnect()
     
+    async def _acquire_client(self):
+        """Point self.client at the pooled client for this session, connecting it if needed."""
+        key = (str(self.api_id), self.session_name)
+        async with _get_client_pool_lock():
+            client = _CLIENT_POOL.get(key)
+            if client is None or not client.is_connected():
+                # Nothing here handles updates, so ask Telegram not to push them;
+                # the connection then carries only our own requests
+                client = TelegramClient(
+                    MmapSQLiteSession(self.session_name), self.api_id, self.api_hash,
+                    receive_updates=False
+                )
+                # Connect without interactive prompts (only works if session exists)
+                await client.connect()
+                _CLIENT_POOL[key] = client
+            if self.client is client:
+                return
+            stale, self.client = self.client, client
+            _CLIENT_REFS[client] = _CLIENT_REFS.get(client, 0) + 1
+            # Moving off a dropped client releases our hold on it
+            stale = stale if stale is not None and _release_client(key, stale) else None
+        if stale is not None:
+            await stale.disconnect()
+    
+    def _get_connect_lock(self) -> asyncio.Lock:
+        """Return this manager's connect lock, created inside the running loop."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        return self._connect_lock
+    
+    async def _is_ready(self) -> bool:
+        """True if already connected and logged in as the user in self.me."""
+        return bool(self.me and self.client and self.client.is_connected()
+                    and await self.client.is_user_authorized())
+    
     async def connect(self):
-        """Connect to Telegram."""
+        """Connect to Telegram.
+        
+        Concurrent calls are serialized, and a call on a manager that is
+        already connected and authorized returns straight away.
+        """
+        async with self._get_connect_lock():
+            if await self._is_ready():
+                return True
+            return await self._connect()
+    
+    async def _connect(self):
+        """Connect to Telegram (caller holds the connect lock)."""
         try:
-            self.client = TelegramClient(self.session_name, self.api_id, self.api_hash)
-
-            # Connect without interactive prompts (only works if session exists)
-            await self.client.connect()
+            await self._acquire_client()
 
             # Check if we're logged in
             if not await self.client.is_user_authorized():
@@ -78,9 +283,10 @@ class TelegramContactManager:
                 self.logger.error("ERROR: This session is authenticated as a BOT, not a regular user!")
                 self.logger.error("Telegram does not allow bots to add contacts by phone number.")
                 self.logger.error("Please delete the session files and re-authenticate with a USER account.")
-                await self.client.disconnect()
+                await self.disconnect()
                 raise Exception("Bot session detected. Please authenticate with a user account, not a bot.")
 
+            self.me = user
             self.logger.info(f"Connected as {user.first_name} (@{user.username})")
             return True
 
@@ -89,22 +295,40 @@ class TelegramContactManager:
             return False
     
     async def disconnect(self):
-        """Disconnect from Telegram."""
-        if self.client:
-            await self.client.disconnect()
+        """Disconnect from Telegram.
+        
+        The shared connection is only closed once no other manager uses it.
+        """
+        client, self.client = self.client, None
+        if not client:
+            return
+        
+        key = (str(self.api_id), self.session_name)
+        async with _get_client_pool_lock():
+            if not _release_client(key, client):
+                return
+        await client.disconnect()
     
     async def login_with_phone(self, phone_number: str):
         """Authenticate with phone number."""
+        async with self._get_connect_lock():
+            if await self._is_ready():
+                return True
+            return await self._login_with_phone(phone_number)
+    
+    async def _login_with_phone(self, phone_number: str):
+        """Authenticate with phone number (caller holds the connect lock)."""
         try:
             if not self.client:
-                self.client = TelegramClient(self.session_name, self.api_id, self.api_hash)
+                await self._acquire_client()
 
             # Use a lambda to provide the phone number automatically
-            # This prevents Telethon from asking for bot token
+            # This prevents Telethon from asking for bot token. The prompts
+            # are awaited on a thread so they don't block the event loop.
             await self.client.start(
                 phone=lambda: phone_number,
-                code_callback=lambda: input('Please enter the code you received: '),
-                password=lambda: input('Please enter your 2FA password (if enabled): ')
+                code_callback=lambda: run_blocking(input, 'Please enter the code you received: '),
+                password=lambda: run_blocking(input, 'Please enter your 2FA password (if enabled): ')
             )
 
             if await self.client.is_user_authorized():
@@ -113,9 +337,10 @@ class TelegramContactManager:
                 # Check if it's a bot (this shouldn't happen with phone auth, but double-check)
                 if user.bot:
                     self.logger.error("ERROR: Authenticated as a BOT instead of a user!")
-                    await self.client.disconnect()
+                    await self.disconnect()
                     return False
 
+                self.me = user
                 self.logger.info(f"Successfully logged in as {user.first_name}")
                 return True
             else:
@@ -126,40 +351,117 @@ class TelegramContactManager:
             self.logger.error(f"Login error: {e}")
             return False
     
+    def pacing_delay(self) -> float:
+        """Seconds a caller should pause between bulk batches.
+        
+        Zero unless Telegram has sent a flood wait in the last
+        FLOOD_WINDOW seconds; then 2**n seconds (capped at 30) for n
+        recent flood waits.
+        """
+        cutoff = time.monotonic() - self.FLOOD_WINDOW
+        while self._flood_times and self._flood_times[0] < cutoff:
+            self._flood_times.popleft()
+        if not self._flood_times:
+            return 0.0
+        return min(2 ** len(self._flood_times), 30)
+    
+    async def _throttle(self):
+        """Wait until the rate limiter allows another request."""
+        while not self._rate_limiter.try_consume():
+            await asyncio.sleep(self._rate_limiter.time_until_next())
+    
+    async def _with_retry(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await call() (a single RPC), retrying transient failures.
+        
+        Connection, timeout and server errors back off exponentially with
+        full jitter. A flood wait sleeps the time Telegram asks for plus up
+        to a second of jitter, so parallel batches don't all resume at once;
+        waits longer than RPC_MAX_FLOOD_WAIT are raised to the caller.
+        """
+        for attempt in range(1, self.RPC_MAX_TRIES + 1):
+            await self._throttle()
+            try:
+                return await call()
+            except errors.FloodWaitError as e:
+                # We were sending faster than Telegram allows; pace ourselves down
+                self._rate_limiter.slow_down()
+                self._flood_times.append(time.monotonic())
+                if attempt == self.RPC_MAX_TRIES or e.seconds > self.RPC_MAX_FLOOD_WAIT:
+                    raise
+                delay = e.seconds + random.uniform(0, 1)
+                self.logger.warning(f"Rate limited. Waiting {delay:.1f} seconds before retrying")
+            except (ConnectionError, asyncio.TimeoutError, errors.ServerError) as e:
+                if attempt == self.RPC_MAX_TRIES:
+                    raise
+                delay = random.uniform(0, min(self.RPC_BACKOFF_CAP, self.RPC_BACKOFF_BASE * 2 ** attempt))
+                self.logger.warning(f"Telegram request failed ({e!r}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
     async def add_contacts_bulk(self, phone_numbers: List[PhoneNumber],
-                               batch_size: int = 50,
-                               name_prefix: str = "Contact") -> Dict[str, Any]:
-        """Add multiple contacts to Telegram in batches."""
+                               batch_size: int = MAX_IMPORT_CONTACTS,
+                               name_prefix: str = "Contact",
+                               max_concurrent_batches: Optional[int] = None,
+                               on_batch: Optional[Callable[[int, List[PhoneNumber], Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Add multiple contacts to Telegram.
+        
+        Sent as one ImportContactsRequest, split only when there are more
+        than `batch_size` numbers; up to `max_concurrent_batches` (default:
+        import.concurrency from the config) of those requests are in flight
+        at once. If given, `on_batch` is called with each chunk's index, its
+        numbers and its result as soon as that chunk finishes.
+        """
         if not self.client or not await self.client.is_user_authorized():
             raise Exception("Not connected or not authorized")
 
         # Filter valid phone numbers
         valid_numbers = [p for p in phone_numbers if p.is_valid]
 
-        results = {
+        if max_concurrent_batches is None:
+            max_concurrent_batches = config.get('import.concurrency', 3)
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_batches))
+        batches = [valid_numbers[i:i + batch_size] for i in range(0, len(valid_numbers), batch_size)]
+        
+        async def run_batch(index: int, batch: List[PhoneNumber]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    batch_result = await self._add_contacts_batch(batch, name_prefix=name_prefix)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # A chunk that raised counts as failed, like one whose request failed
+                    self.logger.error(f"Error importing contacts: {e}")
+                    batch_result = {
+                        'successful': 0,
+                        'failed': len(batch),
+                        'errors': [str(e)],
+                        'imported_contacts': [],
+                        'imported_phones': []
+                    }
+                
+                if on_batch:
+                    on_batch(index, batch, batch_result)
+                
+                # Only hold the slot if Telegram has recently asked us to slow down
+                if index < len(batches) - 1:
+                    delay = self.pacing_delay()
+                    if delay:
+                        await asyncio.sleep(delay)
+                
+                return batch_result
+        
+        batch_results = await asyncio.gather(*(run_batch(i, batch) for i, batch in enumerate(batches)))
+        
+        def merged(key: str) -> list:
+            return list(chain.from_iterable(r[key] for r in batch_results))
+        
+        return {
             'total_attempted': len(valid_numbers),
-            'successful': 0,
-            'failed': 0,
-            'errors': [],
-            'imported_contacts': []
+            'successful': sum(r['successful'] for r in batch_results),
+            'failed': sum(r['failed'] for r in batch_results),
+            'errors': merged('errors'),
+            'imported_contacts': merged('imported_contacts'),
+            'imported_phones': merged('imported_phones')
         }
-
-        # Process in batches
-        for i in range(0, len(valid_numbers), batch_size):
-            batch = valid_numbers[i:i + batch_size]
-            batch_result = await self._add_contacts_batch(batch, name_prefix=name_prefix)
-            
-            # Merge results
-            results['successful'] += batch_result['successful']
-            results['failed'] += batch_result['failed']
-            results['errors'].extend(batch_result['errors'])
-            results['imported_contacts'].extend(batch_result['imported_contacts'])
-            
-            # Small delay between batches to avoid rate limiting
-            if i + batch_size < len(valid_numbers):
-                await asyncio.sleep(1)
-        
-        return results
     
     async def _add_contacts_batch(self, phone_numbers: List[PhoneNumber], name_prefix: str = "Contact") -> Dict[str, Any]:
         """Add a batch of contacts using ImportContactsRequest (force import method)."""
@@ -170,46 +472,59 @@ class TelegramContactManager:
                 'successful': 0,
                 'failed': len(phone_numbers),
                 'errors': ["Client not connected"],
-                'imported_contacts': []
+                'imported_contacts': [],
+                'imported_phones': []
             }
 
-        # Build list of InputPhoneContact objects
-        contacts = []
-        for i, phone in enumerate(phone_numbers):
-            # Remove + sign for the phone field
-            phone_clean = phone.formatted.replace('+', '')
-
-            # Create contact entry with custom prefix
-            contact = InputPhoneContact(
-                client_id=i,
-                phone=phone_clean,
-                first_name=f"{name_prefix} {phone.formatted[-4:]}",
-                last_name=""
-            )
-            contacts.append(contact)
+        # Build list of InputPhoneContact objects, named "<prefix> <last 4 digits>".
+        # The phone field is sent without the + sign. Arguments are positional
+        # (client_id, phone, first_name, last_name): keyword calls into
+        # Telethon's generated __init__ are about twice as slow.
+        first_name_prefix = name_prefix + " "
+        contacts = [
+            InputPhoneContact(i, formatted.lstrip('+'), first_name_prefix + formatted[-4:], "")
+            for i, formatted in enumerate(phone.formatted for phone in phone_numbers)
+        ]
 
         try:
             # Use ImportContactsRequest - this forces the import even if user not found
             # Telegram will add them to contacts if they exist on Telegram
             self.logger.info(f"Importing {len(contacts)} contacts using ImportContactsRequest...")
-            result = await self.client(ImportContactsRequest(contacts))
-
-            successful = len(result.imported) if hasattr(result, 'imported') else 0
+            result = await self._with_retry(lambda: self.client(ImportContactsRequest(contacts)))
+            imported = list(getattr(result, 'imported', None) or [])
+            
+            # Telegram lists contacts it could not import right now by client_id;
+            # send just those once more rather than failing them outright
+            retry_ids = set(getattr(result, 'retry_contacts', None) or ())
+            if retry_ids:
+                self.logger.info(f"Retrying {len(retry_ids)} contacts...")
+                # client_id is the contact's index, so no scan of the whole batch
+                retry_contacts = [contacts[client_id] for client_id in sorted(retry_ids)]
+                retry_result = await self._with_retry(lambda: self.client(ImportContactsRequest(retry_contacts)))
+                imported.extend(getattr(retry_result, 'imported', None) or [])
+                retry_ids = set(getattr(retry_result, 'retry_contacts', None) or ())
+
+            successful = len(imported)
             failed = len(contacts) - successful
+            # ImportedContact carries the client_id we sent, i.e. the index into phone_numbers
+            imported_phones = [phone_numbers[c.client_id].formatted for c in imported]
+            self._remember_contacts(imported_phones)
 
             # Log results
             self.logger.info(f"Import result: {successful} successful, {failed} failed")
 
-            # Extract errors if any
-            errors = []
-            if hasattr(result, 'retry_contacts') and result.retry_contacts:
-                errors.append(f"{len(result.retry_contacts)} contacts need retry")
+            # Extract errors if any; not named `errors`, which would shadow
+            # telethon.errors in the except clauses below
+            batch_errors = []
+            if retry_ids:
+                batch_errors.append(f"{len(retry_ids)} contacts need retry")
 
             return {
                 'successful': successful,
                 'failed': failed,
-                'errors': errors,
-                'imported_contacts': result.imported if hasattr(result, 'imported') else []
+                'errors': batch_errors,
+                'imported_contacts': imported,
+                'imported_phones': imported_phones
             }
 
         except errors.FloodWaitError as e:
@@ -218,7 +533,8 @@ class TelegramContactManager:
                 'successful': 0,
                 'failed': len(contacts),
                 'errors': [f"Rate limited: wait {e.seconds} seconds"],
-                'imported_contacts': []
+                'imported_contacts': [],
+                'imported_phones': []
             }
 
         except Exception as e:
@@ -232,7 +548,8 @@ class TelegramContactManager:
                 'successful': 0,
                 'failed': len(contacts),
                 'errors': [error_msg],
-                'imported_contacts': []
+                'imported_contacts': [],
+                'imported_phones': []
             }
     
     async def add_single_contact(self, phone: PhoneNumber,
@@ -258,7 +575,7 @@ class TelegramContactManager:
 
         try:
             # Remove the + sign
-            phone_clean = phone.formatted.replace('+', '')
+            phone_clean = phone.formatted.lstrip('+')
 
             # Use ImportContactsRequest to force add the contact
             contact = InputPhoneContact(
@@ -269,10 +586,11 @@ class TelegramContactManager:
             )
 
             self.logger.info(f"Force importing contact: {phone.formatted}")
-            result = await self.client(ImportContactsRequest([contact]))
+            result = await self._with_retry(lambda: self.client(ImportContactsRequest([contact])))
 
             # Check if successful
             if hasattr(result, 'imported') and len(result.imported) > 0:
+                self._remember_contacts([phone.formatted])
                 self.logger.info(f"Successfully imported contact: {phone.formatted}")
                 return True
             else:
@@ -290,29 +608,51 @@ class TelegramContactManager:
                 self.logger.error(f"Error importing contact {phone.formatted}: {e}")
             return False
     
-    async def get_existing_contacts(self) -> List[str]:
-        """Get list of existing contact phone numbers."""
+    async def get_existing_contacts(self, force_refresh: bool = False) -> FrozenSet[str]:
+        """Get the set of existing contact phone numbers (E.164, with +).
+        
+        A set, so callers can test many numbers against it in O(1) each.
+        Unless `force_refresh` is set, the list is fetched at most once every
+        CONTACTS_CACHE_TTL seconds; numbers imported in between are added to
+        the cached set.
+        """
+        if (not force_refresh and self._contacts_set is not None
+                and time.monotonic() - self._contacts_ts < self.CONTACTS_CACHE_TTL):
+            return self._contacts_set
+        
         try:
-            contacts = await self.client.get_contacts()
-            phone_numbers = []
-            
-            for contact in contacts:
-                if hasattr(contact, 'phone') and contact.phone:
-                    phone_numbers.append(f"+{contact.phone}")
-            
-            return phone_numbers
-            
+            # TelegramClient has no get_contacts() helper; this is the raw RPC.
+            # hash=0 always returns the full list.
+            result = await self._with_retry(lambda: self.client(GetContactsRequest(hash=0)))
         except Exception as e:
             self.logger.error(f"Error getting existing contacts: {e}")
-            return []
+            return frozenset()
+        
+        # Project each user straight to its number; no intermediate list, and
+        # one attribute lookup per user
+        self._contacts_set = frozenset(
+            "+" + phone
+            for phone in (getattr(user, 'phone', None) for user in getattr(result, 'users', ()))
+            if phone
+        )
+        self._contacts_ts = time.monotonic()
+        return self._contacts_set
+    
+    def _remember_contacts(self, phones: List[str]):
+        """Add just-imported numbers to the cached contact set, if there is one."""
+        if phones and self._contacts_set is not None:
+            self._contacts_set = self._contacts_set.union(phones)
     
     async def check_contact_exists(self, phone: PhoneNumber) -> bool:
         """Check if a contact already exists."""
         existing = await self.get_existing_contacts()
         return phone.formatted in existing
     
-    def save_session_info(self, file_path: str = "telegram_session.json"):
-        """Save session information for later use."""
+    async def save_session_info(self, file_path: str = "telegram_session.json"):
+        """Save session information for later use.
+        
+        The write runs on a worker thread so it doesn't stall the event loop.
+        """
         info = {
             'api_id': self.api_id,
             'api_hash': self.api_hash,
@@ -320,15 +660,15 @@ class TelegramContactManager:
             'session_file': str(self.session_path)
         }
         
-        with open(file_path, 'w') as f:
-            json.dump(info, f, indent=2)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, Path(file_path).write_bytes, json_dumps_indented(info))
     
     @classmethod
-    def load_session_info(cls, file_path: str = "telegram_session.json"):
-        """Load session information from file."""
+    async def load_session_info(cls, file_path: str = "telegram_session.json"):
+        """Load session information from file (read on a worker thread)."""
+        loop = asyncio.get_running_loop()
         try:
-            with open(file_path, 'r') as f:
-                info = json.load(f)
+            info = json_loads(await loop.run_in_executor(None, Path(file_path).read_bytes))
             
             return cls(
                 api_id=info['api_id'],
@@ -1,11 +1,17 @@
 """Logging and progress tracking utilities."""
 
+import asyncio
+import atexit
 import json
 import logging
+import queue
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 # Import with fallback for missing packages
 try:
@@ -20,6 +26,17 @@ try:
 except ImportError:
     COLORAMA_AVAILABLE = False
 
+# orjson is optional; both variants return one compact JSON line as UTF-8 bytes
+try:
+    from orjson import OPT_APPEND_NEWLINE
+    from orjson import dumps as _orjson_dumps
+    
+    def json_dumps_line(obj) -> bytes:
+        return _orjson_dumps(obj, option=OPT_APPEND_NEWLINE)
+except ImportError:
+    def json_dumps_line(obj) -> bytes:
+        return (json.dumps(obj) + '\n').encode('utf-8')
+
 # Fallback implementations
 if not TQDM_AVAILABLE:
     class tqdm_class:
@@ -65,10 +82,16 @@ class ProgressTracker:
         self.successful = 0
         self.failed = 0
         self.start_time = datetime.now()
+        # Elapsed-time math uses the monotonic clock; start_time is for display
+        self._start_monotonic = time.monotonic()
         self.file_path = file_path
+        # Log file entries are handed to a writer thread; see _init_log_file
+        self._log_queue: Optional[queue.SimpleQueue] = None
+        self._log_writer: Optional[threading.Thread] = None
         
         # Setup progress bar
-        self.pbar = tqdm_class(total=total, desc=description, unit="item")
+        # mininterval caps redraws at two per second however fast updates come
+        self.pbar = tqdm_class(total=total, desc=description, unit="item", mininterval=0.5)
         
         # Setup logger
         self.logger = logging.getLogger(f"progress.{description.lower().replace(' ', '_')}")
@@ -78,22 +101,57 @@ class ProgressTracker:
             self._init_log_file()
     
     def _init_log_file(self):
-        """Initialize progress log file."""
+        """Initialize progress log file.
+        
+        The log is JSON Lines: a {"header": ...} line, one line per update()
+        and a final {"summary": ...} line, so each update is a single append.
+        Like the logging set up by start_log_listener, entries are queued and
+        written by a background thread through one buffered file handle.
+        """
         if not self.file_path:
             return
             
-        log_data = {
+        header = {
             'session_start': self.start_time.isoformat(),
             'description': self.description,
-            'total': self.total,
-            'progress_log': []
+            'total': self.total
         }
         
         try:
-            with open(self.file_path, 'w') as f:
-                json.dump(log_data, f, indent=2)
+            log_file = open(self.file_path, 'wb', buffering=1 << 16)
+            log_file.write(json_dumps_line({'header': header}))
         except Exception as e:
             self.logger.warning(f"Could not initialize log file: {e}")
+            return
+        
+        self._log_queue = queue.SimpleQueue()
+        self._log_writer = threading.Thread(
+            target=self._write_log_entries, args=(log_file,), daemon=True
+        )
+        self._log_writer.start()
+        # Flush what's queued if finish() is never called
+        atexit.register(self._close_log_file)
+    
+    def _write_log_entries(self, log_file):
+        """Writer thread: write queued entries until the None sentinel."""
+        with log_file:
+            while True:
+                entry = self._log_queue.get()
+                if entry is None:
+                    return
+                try:
+                    log_file.write(json_dumps_line(entry))
+                except Exception as e:
+                    self.logger.warning(f"Could not update log file: {e}")
+    
+    def _close_log_file(self):
+        """Stop the writer thread once it has written everything queued."""
+        if self._log_writer is None:
+            return
+        self._log_queue.put(None)
+        self._log_writer.join()
+        self._log_writer = None
+        atexit.unregister(self._close_log_file)
     
     def update(self, success: bool = True, message: Optional[str] = None, data: Any = None):
         """Update progress with success/failure info."""
@@ -115,27 +173,53 @@ class ProgressTracker:
         if self.file_path:
             self._update_log_file(success, message, data)
     
-    def _log_progress(self, success: bool, message: Optional[str] = None, data: Any = None):
-        """Log progress information."""
-        status = "SUCCESS" if success else "FAILED"
-        elapsed = datetime.now() - self.start_time
-        rate = self.current / elapsed.total_seconds() if elapsed.total_seconds() > 0 else 0
+    def update_many(self, successful: int, failed: int = 0,
+                    message: Optional[str] = None, data: Any = None):
+        """Record a whole batch of results with one progress update.
+        
+        Logs (and writes a log file entry) once for the batch rather than
+        once per item.
+        """
+        count = successful + failed
+        if not count:
+            return
+        previous = self.current
+        self.current += count
+        self.successful += successful
+        self.failed += failed
         
-        log_msg = f"Progress: {self.current}/{self.total} ({self.current/self.total*100:.1f}%) | "
-        log_msg += f"Success: {self.successful} | Failed: {self.failed} | "
-        log_msg += f"Rate: {rate:.1f} items/sec"
+        self.pbar.update(count)
         
-        if message:
-            log_msg += f" | {message}"
+        # Log if the batch crossed a log interval or had failures
+        success = not failed
+        if self.current // self.log_interval != previous // self.log_interval or not success:
+            self._log_progress(success, message, data)
         
-        if success:
-            self.logger.info(log_msg)
-        else:
-            self.logger.warning(f"{status}: {log_msg}")
+        if self.file_path:
+            self._update_log_file(success, message, data)
+    
+    def _log_progress(self, success: bool, message: Optional[str] = None, data: Any = None):
+        """Log progress information."""
+        level = logging.INFO if success else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        elapsed = time.monotonic() - self._start_monotonic
+        rate = self.current / elapsed if elapsed > 0 else 0
+        
+        # %-style arguments are only formatted if a handler emits the record
+        self.logger.log(
+            level,
+            "%sProgress: %d/%d (%.1f%%) | Success: %d | Failed: %d | Rate: %.1f items/sec%s",
+            "" if success else "FAILED: ",
+            self.current, self.total, self.current / self.total * 100,
+            self.successful, self.failed, rate,
+            f" | {message}" if message else ""
+        )
     
     def _update_log_file(self, success: bool, message: Optional[str] = None, data: Any = None):
         """Update progress log file."""
-        if not self.file_path:
+        if self._log_writer is None:
             return
         
         entry = {
@@ -143,43 +227,27 @@ class ProgressTracker:
             'item_number': self.current,
             'success': success,
             'message': message,
-            'data': data
+            'data': data,
+            # Running totals, so the last line shows the progress so far
+            'successful': self.successful,
+            'failed': self.failed
         }
         
-        try:
-            # Read existing log
-            with open(self.file_path, 'r') as f:
-                log_data = json.load(f)
-            
-            # Append new entry
-            log_data['progress_log'].append(entry)
-            log_data['current_progress'] = {
-                'current': self.current,
-                'successful': self.successful,
-                'failed': self.failed,
-                'completion_percentage': (self.current / self.total * 100) if self.total > 0 else 0
-            }
-            
-            # Write back
-            with open(self.file_path, 'w') as f:
-                json.dump(log_data, f, indent=2)
-                
-        except Exception as e:
-            self.logger.warning(f"Could not update log file: {e}")
+        self._log_queue.put(entry)
     
     def finish(self, summary_message: Optional[str] = None):
         """Finish progress tracking and log summary."""
         self.pbar.close()
         
-        elapsed = datetime.now() - self.start_time
+        elapsed = time.monotonic() - self._start_monotonic
         
         summary = {
             'total_processed': self.current,
             'successful': self.successful,
             'failed': self.failed,
             'success_rate': (self.successful / self.current * 100) if self.current > 0 else 0,
-            'elapsed_time': str(elapsed),
-            'average_rate': self.current / elapsed.total_seconds() if elapsed.total_seconds() > 0 else 0
+            'elapsed_time': str(timedelta(seconds=elapsed)),
+            'average_rate': self.current / elapsed if elapsed > 0 else 0
         }
         
         self.logger.info(f"Progress completed: {summary}")
@@ -195,25 +263,18 @@ class ProgressTracker:
     
     def _finalize_log_file(self, summary: dict):
         """Finalize progress log file."""
-        if not self.file_path:
+        if self._log_writer is None:
             return
-            
-        try:
-            with open(self.file_path, 'r') as f:
-                log_data = json.load(f)
-            
-            log_data['session_end'] = datetime.now().isoformat()
-            log_data['summary'] = summary
-            
-            with open(self.file_path, 'w') as f:
-                json.dump(log_data, f, indent=2)
-                
-        except Exception as e:
-            self.logger.warning(f"Could not finalize log file: {e}")
+        
+        self._log_queue.put({
+            'session_end': datetime.now().isoformat(),
+            'summary': summary
+        })
+        self._close_log_file()
     
     def get_summary(self) -> dict:
         """Get current progress summary."""
-        elapsed = datetime.now() - self.start_time
+        elapsed = time.monotonic() - self._start_monotonic
         
         return {
             'current': self.current,
@@ -222,9 +283,9 @@ class ProgressTracker:
             'failed': self.failed,
             'completion_percentage': (self.current / self.total * 100) if self.total > 0 else 0,
             'success_rate': (self.successful / self.current * 100) if self.current > 0 else 0,
-            'elapsed_time': str(elapsed),
+            'elapsed_time': str(timedelta(seconds=elapsed)),
             'estimated_remaining': self._estimate_remaining_time(),
-            'average_rate': self.current / elapsed.total_seconds() if elapsed.total_seconds() > 0 else 0
+            'average_rate': self.current / elapsed if elapsed > 0 else 0
         }
     
     def _estimate_remaining_time(self) -> str:
@@ -232,8 +293,8 @@ class ProgressTracker:
         if self.current == 0:
             return "Unknown"
         
-        elapsed = datetime.now() - self.start_time
-        rate = self.current / elapsed.total_seconds()
+        elapsed = time.monotonic() - self._start_monotonic
+        rate = self.current / elapsed if elapsed > 0 else 0
         
         if rate > 0:
             remaining_items = self.total - self.current
@@ -268,49 +329,72 @@ class ContactImportLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
+        # Replace the handlers an earlier instance attached to this shared
+        # logger, so records aren't written once per instance
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+        
         # Add handlers
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
         self.logger.setLevel(logging.DEBUG)
+        # These handlers cover it; don't emit again through setup_logging's root handlers
+        self.logger.propagate = False
     
     def log_session_start(self, total_contacts: int, file_path: str):
         """Log session start information."""
-        self.logger.info(f"=== Contact Import Session Started ===")
-        self.logger.info(f"File: {file_path}")
-        self.logger.info(f"Total contacts to process: {total_contacts}")
-        self.logger.info(f"Session started at: {datetime.now()}")
+        self.logger.info("=== Contact Import Session Started ===")
+        self.logger.info("File: %s", file_path)
+        self.logger.info("Total contacts to process: %d", total_contacts)
+        self.logger.info("Session started at: %s", datetime.now())
     
     def log_contact_result(self, phone_number: str, success: bool, error: Optional[str] = None):
         """Log individual contact import result."""
         if success:
-            self.logger.info(f"SUCCESS: {phone_number} added to contacts")
+            self.logger.info("SUCCESS: %s added to contacts", phone_number)
         else:
-            self.logger.error(f"FAILED: {phone_number} - {error or 'Unknown error'}")
+            self.logger.error("FAILED: %s - %s", phone_number, error or 'Unknown error')
     
     def log_batch_result(self, batch_num: int, total_batches: int, 
                         successful: int, failed: int, errors: Optional[list] = None):
         """Log batch processing result."""
-        self.logger.info(f"Batch {batch_num}/{total_batches} completed: "
-                        f"{successful} successful, {failed} failed")
+        self.logger.info("Batch %d/%d completed: %d successful, %d failed",
+                         batch_num, total_batches, successful, failed)
         
         if errors:
             for error in errors:
-                self.logger.warning(f"Batch error: {error}")
+                self.logger.warning("Batch error: %s", error)
     
     def log_session_end(self, summary: dict):
         """Log session end information."""
-        self.logger.info(f"=== Contact Import Session Completed ===")
-        self.logger.info(f"Total processed: {summary.get('total_processed', 0)}")
-        self.logger.info(f"Successful: {summary.get('successful', 0)}")
-        self.logger.info(f"Failed: {summary.get('failed', 0)}")
-        self.logger.info(f"Success rate: {summary.get('success_rate', 0):.1f}%")
-        self.logger.info(f"Session duration: {summary.get('elapsed_time', 'Unknown')}")
+        self.logger.info("=== Contact Import Session Completed ===")
+        self.logger.info("Total processed: %s", summary.get('total_processed', 0))
+        self.logger.info("Successful: %s", summary.get('successful', 0))
+        self.logger.info("Failed: %s", summary.get('failed', 0))
+        self.logger.info("Success rate: %.1f%%", summary.get('success_rate', 0))
+        self.logger.info("Session duration: %s", summary.get('elapsed_time', 'Unknown'))
     
     def get_log_file_path(self) -> str:
         """Get the log file path."""
         return self.log_file
 
 
+def start_log_listener(*handlers: logging.Handler) -> Tuple[QueueHandler, QueueListener]:
+    """Front the given handlers with a queue drained by a background thread.
+    
+    Attach the returned QueueHandler to a logger; records are then written
+    by the listener thread, so logging calls (e.g. inside the import loop)
+    don't block on disk or terminal writes. The listener is stopped, which
+    flushes any queued records, at interpreter exit.
+    """
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return QueueHandler(log_queue), listener
+
+
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None, console: bool = True):
     """Setup application logging."""
     numeric_level = getattr(logging, level.upper(), logging.INFO)
@@ -322,13 +406,15 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None, console:
         handlers=[]
     )
     
+    handlers = []
+    
     # Add file handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(numeric_level)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
-        logging.getLogger().addHandler(file_handler)
+        handlers.append(file_handler)
     
     # Add console handler if enabled
     if console:
@@ -336,4 +422,51 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None, console:
         console_handler.setLevel(numeric_level)
         formatter = logging.Formatter('%(levelname)s - %(message)s')
         console_handler.setFormatter(formatter)
-        logging.getLogger().addHandler(console_handler)
\ No newline at end of file
+        handlers.append(console_handler)
+    
+    if handlers:
+        queue_handler, listener = start_log_listener(*handlers)
+        logging.getLogger().addHandler(queue_handler)
+        return listener
+    
+    return None
+
+
+def install_uvloop() -> bool:
+    """Make asyncio.run() use uvloop's event loop when uvloop is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+async def run_blocking(func, *args):
+    """Run a blocking call (e.g. input()) on a daemon thread and await its result.
+    
+    Like asyncio.to_thread(), but the thread is a daemon: a prompt abandoned by
+    Ctrl-C doesn't keep the interpreter alive waiting for Enter at exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def target():
+        try:
+            result = func(*args)
+        except BaseException as e:
+            loop.call_soon_threadsafe(settle, None, e)
+        else:
+            loop.call_soon_threadsafe(settle, result, None)
+    
+    threading.Thread(target=target, daemon=True).start()
+    return await future
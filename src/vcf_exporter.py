@@ -3,10 +3,71 @@
 import logging
 from pathlib import Path
 from typing import List
-import vobject
 
 from .phone_parser import PhoneNumber
 
+# One vCard 3.0 entry, as vobject would serialize it. VCF is a simple
+# line-based format, so building it from a template avoids creating and
+# serializing a vobject.vCard per contact.
+VCARD_TEMPLATE = (
+    "BEGIN:VCARD\r\n"
+    "VERSION:3.0\r\n"
+    "{fn}"
+    "{n}"
+    "TEL;TYPE=CELL:{tel}\r\n"
+    "END:VCARD\r\n"
+)
+
+# Longest content line, in UTF-8 bytes, before it is folded (RFC 2425)
+LINE_LENGTH = 75
+
+
+def escape_text(value: str) -> str:
+    """Escape a vCard text value (backslash, comma, semicolon and newline)."""
+    return (value.replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+
+def fold_line(line: str) -> str:
+    """Terminate a content line with CRLF, folding it if it is too long.
+    
+    Follows vobject: folds fall between characters, never inside a
+    multi-byte UTF-8 sequence.
+    """
+    if len(line.encode('utf-8')) < LINE_LENGTH:
+        return line + "\r\n"
+    
+    parts = []
+    counter = 0
+    for char in line:
+        size = len(char.encode('utf-8'))
+        if counter + size > LINE_LENGTH:
+            parts.append("\r\n ")
+            counter = 1
+        parts.append(char)
+        counter += size
+    parts.append("\r\n")
+    return "".join(parts)
+
+
+def prefixed_card_template(prefix: str) -> str:
+    """VCARD_TEMPLATE with the (escaped) name prefix already filled in.
+    
+    The result only takes {last4} and {tel}. Every contact's name lines are
+    the same length, so when they are short enough not to fold they can be
+    baked in once instead of built and fold-checked per contact.
+    """
+    longest = max(f"FN:{prefix} 0000", f"N:0000;{prefix};;;", key=len)
+    if len(longest.encode('utf-8')) >= LINE_LENGTH:
+        # Long prefixes fold; callers fall back to formatting each card
+        return ""
+    prefix = prefix.replace("{", "{{").replace("}", "}}")
+    return VCARD_TEMPLATE.format(
+        fn=f"FN:{prefix} {{last4}}\r\n",
+        n=f"N:{{last4}};{prefix};;;\r\n",
+        tel="{tel}"
+    )
+
 
 class VCFExporter:
     """Export phone numbers to VCF format."""
@@ -34,29 +95,27 @@ class VCFExporter:
                 self.logger.error("No valid phone numbers to export")
                 return False
 
-            # Create VCF file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for i, phone in enumerate(valid_numbers, 1):
-                    # Create vCard object
-                    vcard = vobject.vCard()
-
-                    # Add name
-                    vcard.add('fn')
-                    vcard.fn.value = f"{name_prefix} {phone.formatted[-4:]}"
-
-                    vcard.add('n')
-                    vcard.n.value = vobject.vcard.Name(
-                        family=f"{phone.formatted[-4:]}",
-                        given=name_prefix
+            # Named "<prefix> <last 4 digits>", with the digits as the family name
+            prefix = escape_text(name_prefix)
+            template = prefixed_card_template(prefix)
+            if template:
+                cards = [
+                    template.format(last4=formatted[-4:], tel=formatted)
+                    for formatted in (phone.formatted for phone in valid_numbers)
+                ]
+            else:
+                cards = [
+                    VCARD_TEMPLATE.format(
+                        fn=fold_line(f"FN:{prefix} {phone.formatted[-4:]}"),
+                        n=fold_line(f"N:{phone.formatted[-4:]};{prefix};;;"),
+                        tel=phone.formatted
                     )
+                    for phone in valid_numbers
+                ]
 
-                    # Add phone number
-                    vcard.add('tel')
-                    vcard.tel.value = phone.formatted
-                    vcard.tel.type_param = 'CELL'
-
-                    # Write to file
-                    f.write(vcard.serialize())
+            # Create VCF file; newline='' keeps the CRLFs as written
+            with open(output_file, 'w', encoding='utf-8', newline='') as f:
+                f.write("".join(cards))
 
             self.logger.info(f"Exported {len(valid_numbers)} contacts to {output_file}")
             return True
@@ -4,16 +4,13 @@
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 def test_phone_parsing():
     """Test phone number parsing with the sample data."""
     print("🧪 Testing Phone Number Parser")
     print("="*40)
     
     try:
-        from src.phone_parser import parse_phone_file
+        from src.phone_parser import parse_phone_file, sample_numbers
 
         # Test with the sample file
         file_path = "src/data/HGCS12.txt"
@@ -37,17 +34,16 @@ def test_phone_parsing():
             for code, count in stats['country_codes'].items():
                 print(f"  {code}: {count}")
         
-        # Show some examples
-        valid_numbers = [p for p in phone_numbers if p.is_valid]
+        # Show some examples (one pass that stops once both samples are full)
+        valid_numbers, invalid_numbers = sample_numbers(phone_numbers)
         if valid_numbers:
             print(f"\n✅ Sample valid numbers:")
-            for i, phone in enumerate(valid_numbers[:5]):
+            for i, phone in enumerate(valid_numbers):
                 print(f"  {phone.raw} → {phone.formatted}")
         
-        invalid_numbers = [p for p in phone_numbers if not p.is_valid]
         if invalid_numbers:
             print(f"\n❌ Sample invalid numbers:")
-            for i, phone in enumerate(invalid_numbers[:3]):
+            for i, phone in enumerate(invalid_numbers):
                 print(f"  {phone.raw} - {phone.error_message}")
         
         return stats['success_rate'] > 80  # Consider success if >80% valid
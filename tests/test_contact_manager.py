@@ -0,0 +1,88 @@
+"""Tests for ContactManager's file import, using a stubbed Telegram client."""
+
+import asyncio
+
+import pytest
+
+from src import telegram_client as tc
+from src.contact_manager import ContactManager
+from src.utils import ProgressTracker
+from tests.test_telegram_client import StubClient, import_requests
+
+
+@pytest.fixture
+def phone_file(tmp_path):
+    path = tmp_path / "phones.txt"
+    path.write_text("".join(f"+8529123456{i}\n" for i in range(5)) + "not a number\n")
+    return str(path)
+
+
+@pytest.fixture
+def manager():
+    telegram_manager = tc.TelegramContactManager("1", "hash")
+    telegram_manager.client = StubClient(contacts=["85291234560", "85291234561"])
+    return ContactManager(telegram_manager)
+
+
+def test_import_skips_existing_contacts(manager, phone_file):
+    result = asyncio.run(manager.import_from_file(phone_file))
+
+    stats = result['stats']
+    assert (stats['attempted'], stats['successful'], stats['failed'], stats['skipped']) == (3, 3, 0, 2)
+    assert [op.phone.formatted for op in result['operations']] == [
+        "+85291234562", "+85291234563", "+85291234564"
+    ]
+    assert manager.get_operation_summary()['failed'] == 0
+
+
+def test_import_without_skip_existing_sends_everything(manager, phone_file):
+    result = asyncio.run(manager.import_from_file(phone_file, skip_existing=False))
+
+    stats = result['stats']
+    assert (stats['attempted'], stats['successful'], stats['skipped']) == (5, 5, 0)
+    assert sum(len(r.contacts) for r in import_requests(manager.telegram_manager.client)) == 5
+
+
+def test_import_counts_skips_when_nothing_is_new(manager, phone_file):
+    result = asyncio.run(manager.import_from_file(phone_file, existing_contacts=[
+        f"+8529123456{i}" for i in range(5)
+    ]))
+
+    assert result['message'] == 'All contacts already exist'
+    assert result['stats']['skipped'] == 5
+    assert import_requests(manager.telegram_manager.client) == []
+
+
+def test_import_reports_each_batch_in_file_order(manager, phone_file):
+    progress = []
+    result = asyncio.run(manager.import_from_file(
+        phone_file, skip_existing=False, batch_size=2, concurrency=2,
+        progress_callback=lambda successful, failed: progress.append((successful, failed))
+    ))
+
+    assert sorted(progress) == [(1, 0), (2, 0), (2, 0)]
+    assert [op.phone.formatted for op in result['operations']] == [f"+8529123456{i}" for i in range(5)]
+    assert all(op.success for op in result['operations'])
+
+
+def test_import_marks_a_failed_batch(manager, phone_file):
+    manager.telegram_manager.client.fail_on = {"85291234562"}
+    result = asyncio.run(manager.import_from_file(phone_file, skip_existing=False, batch_size=2))
+
+    assert result['stats']['successful'] == 3
+    assert result['stats']['failed'] == 2
+    failed = [op for op in result['operations'] if not op.success]
+    assert [(op.phone.formatted, op.error_message) for op in failed] == [
+        ("+85291234562", "boom"), ("+85291234563", "boom")
+    ]
+
+
+def test_import_progress_feeds_tracker_per_batch(manager, phone_file):
+    manager.telegram_manager.client.fail_on = {"85291234564"}
+    tracker = ProgressTracker(6, "Importing contacts")
+    asyncio.run(manager.import_from_file(
+        phone_file, skip_existing=False, batch_size=2, progress_callback=tracker.update_many
+    ))
+    summary = tracker.finish()
+
+    assert (summary['total_processed'], summary['successful'], summary['failed']) == (5, 4, 1)
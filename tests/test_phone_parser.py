@@ -0,0 +1,34 @@
+"""Tests for phone file sampling."""
+
+import pytest
+
+from src.phone_parser import PhoneParser, preview_phone_file, sample_numbers
+
+LINES = [
+    "+85291234560", "+85212345670", "+85291234561", "+85212345671",
+    "+85291234562", "+85212345672", "+85212345673",
+]
+
+
+@pytest.fixture
+def phone_file(tmp_path):
+    path = tmp_path / "phones.txt"
+    path.write_text("\n".join(LINES) + "\n")
+    return str(path)
+
+
+def test_sample_numbers_takes_the_first_of_each():
+    parser = PhoneParser()
+    numbers = [parser.parse_number(line) for line in LINES]
+    valid, invalid = sample_numbers(numbers, valid_limit=2, invalid_limit=2)
+
+    assert [p.raw for p in valid] == ["+85291234560", "+85291234561"]
+    assert [p.raw for p in invalid] == ["+85212345670", "+85212345671"]
+
+
+def test_preview_samples_and_counts_the_whole_file(phone_file):
+    valid, invalid, stats = preview_phone_file(phone_file, valid_limit=2, invalid_limit=2)
+
+    assert [p.raw for p in valid] == ["+85291234560", "+85291234561"]
+    assert [p.raw for p in invalid] == ["+85212345670", "+85212345671"]
+    assert (stats['total'], stats['valid'], stats['invalid']) == (7, 3, 4)
@@ -0,0 +1,290 @@
+"""Tests for the Telegram client wrapper, using stubbed Telethon clients."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src import telegram_client as tc
+from src.phone_parser import PhoneParser
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class StubClient:
+    """Answers GetContactsRequest and ImportContactsRequest without a network.
+
+    `retry_once` lists client_ids reported in retry_contacts on the first
+    import; `not_found` lists phones (without +) Telegram "can't" import,
+    and an import request containing a phone in `fail_on` raises.
+    """
+
+    def __init__(self, contacts=(), retry_once=(), not_found=(), fail_on=()):
+        self.contacts = list(contacts)
+        self.retry_once = set(retry_once)
+        self.not_found = set(not_found)
+        self.fail_on = set(fail_on)
+        self.requests = []
+
+    def is_connected(self):
+        return True
+
+    async def is_user_authorized(self):
+        return True
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        if isinstance(request, tc.GetContactsRequest):
+            return SimpleNamespace(users=[SimpleNamespace(phone=p) for p in self.contacts])
+
+        if any(c.phone in self.fail_on for c in request.contacts):
+            raise RuntimeError("boom")
+        retry = [c.client_id for c in request.contacts if c.client_id in self.retry_once]
+        self.retry_once = set()
+        imported = [
+            SimpleNamespace(client_id=c.client_id) for c in request.contacts
+            if c.client_id not in retry and c.phone not in self.not_found
+        ]
+        return SimpleNamespace(imported=imported, retry_contacts=retry)
+
+
+@pytest.fixture
+def numbers():
+    parser = PhoneParser()
+    return [parser.parse_number(f"+8529123456{i}") for i in range(5)]
+
+
+@pytest.fixture
+def manager():
+    return tc.TelegramContactManager("1", "hash")
+
+
+def import_requests(client):
+    return [r for r in client.requests if isinstance(r, tc.ImportContactsRequest)]
+
+
+class TestTokenBucket:
+
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(tc.time, "monotonic", clock)
+        return clock
+
+    def test_burst_then_paced(self, clock):
+        bucket = tc.TokenBucket(rate=10, capacity=3)
+        assert [bucket.try_consume() for _ in range(4)] == [True, True, True, False]
+        assert bucket.time_until_next() == pytest.approx(0.1)
+
+        clock.now += 0.1
+        assert bucket.try_consume()
+
+    def test_slow_down_halves_then_recovers(self, clock):
+        bucket = tc.TokenBucket(rate=8, capacity=8, min_rate=1)
+        bucket.slow_down(hold=10)
+        assert bucket.rate == 4
+        bucket.slow_down(hold=10)
+        bucket.slow_down(hold=10)
+        bucket.slow_down(hold=10)
+        assert bucket.rate == 1
+
+        # Held at the reduced rate, then additive increase of 1/s per second
+        clock.now += 5
+        bucket.try_consume()
+        assert bucket.rate == 1
+        clock.now += 5
+        bucket.try_consume()
+        assert bucket.rate == 2
+        for _ in range(10):
+            clock.now += 1
+            bucket.try_consume()
+        assert bucket.rate == 8
+
+    def test_min_rate_never_above_configured_rate(self):
+        bucket = tc.TokenBucket(rate=0.2, capacity=1)
+        bucket.slow_down()
+        assert bucket.rate <= 0.2
+
+
+class TestWithRetry:
+
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(tc.asyncio, "sleep", fake_sleep)
+        return sleeps
+
+    def test_flood_wait_is_waited_out_and_retried(self, manager, sleeps):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if len(calls) == 1:
+                raise tc.errors.FloodWaitError(request=None, capture=3)
+            return "ok"
+
+        assert asyncio.run(manager._with_retry(call)) == "ok"
+        assert len(calls) == 2
+        assert 3 <= sleeps[-1] <= 4
+
+    def test_flood_wait_halves_the_request_rate(self, manager):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if len(calls) == 1:
+                raise tc.errors.FloodWaitError(request=None, capture=3)
+            return "ok"
+
+        asyncio.run(manager._with_retry(call))
+        assert manager._rate_limiter.rate == manager.RPC_RATE / 2
+
+    def test_recent_flood_waits_pace_batches(self, manager, monkeypatch):
+        # Continue from the real clock the manager's rate limiter started on
+        clock = FakeClock(time.monotonic())
+        monkeypatch.setattr(tc.time, "monotonic", clock)
+
+        async def flood():
+            raise tc.errors.FloodWaitError(request=None, capture=1)
+
+        assert manager.pacing_delay() == 0
+        with pytest.raises(tc.errors.FloodWaitError):
+            asyncio.run(manager._with_retry(flood))
+        assert manager.pacing_delay() == 30
+
+        clock.now += manager.FLOOD_WINDOW + 1
+        assert manager.pacing_delay() == 0
+
+    def test_long_flood_wait_is_raised(self, manager, sleeps):
+        async def call():
+            raise tc.errors.FloodWaitError(request=None, capture=manager.RPC_MAX_FLOOD_WAIT + 1)
+
+        with pytest.raises(tc.errors.FloodWaitError):
+            asyncio.run(manager._with_retry(call))
+        assert sleeps == []
+
+    def test_transient_errors_give_up_after_max_tries(self, manager, sleeps):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(manager._with_retry(call))
+        assert len(calls) == manager.RPC_MAX_TRIES
+
+    def test_other_errors_are_not_retried(self, manager):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            asyncio.run(manager._with_retry(call))
+        assert len(calls) == 1
+
+
+class TestClientPool:
+
+    class FakeTelegramClient:
+
+        def __init__(self, *args, **kwargs):
+            self.connected = False
+            self.closed = 0
+
+        async def connect(self):
+            self.connected = True
+
+        def is_connected(self):
+            return self.connected
+
+        async def disconnect(self):
+            self.connected = False
+            self.closed += 1
+
+    @pytest.fixture(autouse=True)
+    def pool(self, monkeypatch):
+        monkeypatch.setattr(tc, "TelegramClient", self.FakeTelegramClient)
+        monkeypatch.setattr(tc, "MmapSQLiteSession", lambda name: None)
+        monkeypatch.setattr(tc, "_CLIENT_POOL", {})
+        monkeypatch.setattr(tc, "_CLIENT_REFS", {})
+        monkeypatch.setattr(tc, "_client_pool_lock", None)
+
+    def test_shared_until_last_disconnect(self):
+        async def run():
+            a = tc.TelegramContactManager("1", "hash")
+            b = tc.TelegramContactManager("1", "hash")
+            await a._acquire_client()
+            await b._acquire_client()
+            assert a.client is b.client
+            client = a.client
+
+            await a.disconnect()
+            assert client.is_connected()
+            await b.disconnect()
+            assert client.closed == 1
+            assert tc._CLIENT_POOL == {} and tc._CLIENT_REFS == {}
+
+        asyncio.run(run())
+
+    def test_dropped_client_is_replaced_without_orphaning_holders(self):
+        async def run():
+            a = tc.TelegramContactManager("1", "hash")
+            b = tc.TelegramContactManager("1", "hash")
+            await a._acquire_client()
+            await b._acquire_client()
+            old = a.client
+            old.connected = False
+
+            await a._acquire_client()
+            new = a.client
+            assert new is not old and b.client is old
+
+            # b still holds the old client, so a disconnecting closes only its own
+            await a.disconnect()
+            assert new.closed == 1 and old.closed == 0
+            await b.disconnect()
+            assert old.closed == 1
+            assert tc._CLIENT_POOL == {} and tc._CLIENT_REFS == {}
+
+        asyncio.run(run())
+
+
+class TestImportContacts:
+
+    def test_batch_maps_client_ids_back_to_phones(self, manager, numbers):
+        manager.client = StubClient(retry_once=[1, 3], not_found=["85291234564"])
+        result = asyncio.run(manager._add_contacts_batch(numbers, name_prefix="Lead"))
+
+        assert result['successful'] == 4
+        assert result['failed'] == 1
+        assert result['imported_phones'] == [
+            "+85291234560", "+85291234562", "+85291234561", "+85291234563"
+        ]
+        first, retry = import_requests(manager.client)
+        assert [c.client_id for c in retry.contacts] == [1, 3]
+        assert first.contacts[2].phone == "85291234562"
+        assert first.contacts[2].first_name == "Lead 4562"
+
+    def test_bulk_splits_into_chunks(self, manager, numbers):
+        manager.client = StubClient()
+        result = asyncio.run(manager.add_contacts_bulk(numbers, batch_size=2))
+
+        assert result['successful'] == 5
+        assert [len(r.contacts) for r in import_requests(manager.client)] == [2, 2, 1]
+        assert result['imported_phones'] == [p.formatted for p in numbers]
@@ -0,0 +1,48 @@
+"""Tests for the progress tracking utilities."""
+
+import json
+
+from src.utils import ProgressTracker
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_progress_log_is_json_lines(tmp_path):
+    log_path = tmp_path / "progress.jsonl"
+    tracker = ProgressTracker(3, "Test", file_path=str(log_path))
+    tracker.update()
+    tracker.update(success=False, message="bad", data={"phone": "+1"})
+    summary = tracker.finish()
+
+    header, first, second, end = read_lines(log_path)
+    assert header['header']['total'] == 3
+    assert (first['item_number'], first['success']) == (1, True)
+    assert second['message'] == "bad" and second['data'] == {"phone": "+1"}
+    assert (second['successful'], second['failed']) == (1, 1)
+    assert end['summary'] == summary
+
+
+def test_unserializable_entry_is_skipped(tmp_path):
+    log_path = tmp_path / "progress.jsonl"
+    tracker = ProgressTracker(2, "Test", file_path=str(log_path))
+    tracker.update(data=object())
+    tracker.update()
+    tracker.finish()
+
+    lines = read_lines(log_path)
+    assert [line.get('item_number') for line in lines[1:-1]] == [2]
+
+
+def test_update_many(tmp_path):
+    log_path = tmp_path / "progress.jsonl"
+    tracker = ProgressTracker(10, "Test", file_path=str(log_path))
+    tracker.update_many(4)
+    tracker.update_many(3, 2)
+    tracker.update_many(0)
+    summary = tracker.finish()
+
+    assert (summary['total_processed'], summary['successful'], summary['failed']) == (9, 7, 2)
+    # One entry per batch, not per item
+    assert len(read_lines(log_path)) == 4
@@ -0,0 +1,62 @@
+"""Tests for the VCF exporter."""
+
+import pytest
+
+from src.phone_parser import PhoneParser
+from src.vcf_exporter import LINE_LENGTH, VCFExporter, escape_text, fold_line
+
+
+@pytest.fixture
+def numbers():
+    parser = PhoneParser()
+    return [parser.parse_number("+85291234567"), parser.parse_number("12")]
+
+
+def test_escape_text():
+    assert escape_text("a;b,c\\d\ne") == "a\\;b\\,c\\\\d\\ne"
+    assert escape_text("Contact") == "Contact"
+
+
+def test_short_line_is_not_folded():
+    assert fold_line("FN:Contact 4567") == "FN:Contact 4567\r\n"
+
+
+def test_long_line_is_folded_on_character_boundaries():
+    line = "FN:" + "é" * 60
+    folded = fold_line(line)
+
+    physical = folded.encode("utf-8").split(b"\r\n")[:-1]
+    assert len(physical) > 1
+    assert all(len(part) <= LINE_LENGTH for part in physical)
+    # Continuation lines start with a space and no UTF-8 sequence is split
+    assert all(part.startswith(b" ") for part in physical[1:])
+    assert "".join(p.decode("utf-8")[1:] if i else p.decode("utf-8")
+                   for i, p in enumerate(physical)) == line
+
+
+def test_export_writes_valid_numbers_only(tmp_path, numbers):
+    output = tmp_path / "contacts.vcf"
+    assert VCFExporter().export_to_vcf(numbers, str(output), name_prefix="A;B {x}")
+
+    assert output.read_bytes() == (
+        b"BEGIN:VCARD\r\n"
+        b"VERSION:3.0\r\n"
+        b"FN:A\\;B {x} 4567\r\n"
+        b"N:4567;A\\;B {x};;;\r\n"
+        b"TEL;TYPE=CELL:+85291234567\r\n"
+        b"END:VCARD\r\n"
+    )
+
+
+@pytest.mark.parametrize("prefix", ["x" * 80, "é" * 40])
+def test_export_folds_long_prefixes(tmp_path, numbers, prefix):
+    output = tmp_path / "contacts.vcf"
+    assert VCFExporter().export_to_vcf(numbers, str(output), name_prefix=prefix)
+
+    text = output.read_bytes().decode("utf-8")
+    assert fold_line(f"FN:{prefix} 4567") in text
+    assert fold_line(f"N:4567;{prefix};;;") in text
+
+
+def test_export_without_valid_numbers_fails(tmp_path, numbers):
+    assert not VCFExporter().export_to_vcf(numbers[1:], str(tmp_path / "contacts.vcf"))